@@ -10,7 +10,7 @@ from PySide6.QtWidgets import (
     QPushButton, QHBoxLayout, QMessageBox, QListWidget, QListWidgetItem, QDialog,
     QMenu, QScrollArea, QInputDialog, QFileDialog, QLineEdit, QAbstractItemView
 )
-from PySide6.QtGui import QPixmap, QIcon, QColor
+from PySide6.QtGui import QPixmap, QIcon, QColor, QPixmapCache
 from PySide6.QtCore import Qt, QThreadPool
 
 from ui import (
@@ -55,6 +55,7 @@ class GameSaveBackup(QMainWindow):
         self.save_config()
         
         self.current_game_addition = None
+        self.save_dialog_prefetch = None # SaveSelectionDialog already looking up the typed name
         
         self.threadpool = QThreadPool.globalInstance()
         
@@ -525,6 +526,10 @@ class GameSaveBackup(QMainWindow):
         self.backups_list = QListWidget()
         self.backups_list.itemClicked.connect(self.show_backup_details)
         self.backups_list.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        # Rows are single lines of text, so Qt doesn't need to measure each one
+        self.backups_list.setUniformItemSizes(True)
+        self.backups_list.setLayoutMode(QListWidget.LayoutMode.Batched)
+        self.backups_list.setBatchSize(64)
         right_layout.addWidget(self.backups_list)
         
         self.restore_button = QPushButton("Restore Selected Backup")
@@ -595,9 +600,9 @@ class GameSaveBackup(QMainWindow):
         image_width = 120
         image_height = int(image_width * (352/264))
         
-        if game_data.get("image") and os.path.exists(game_data["image"]):
-            pixmap = QPixmap(game_data["image"])
-            image_label.setPixmap(pixmap.scaled(image_width, image_height, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+        cover = self.load_cover_pixmap(game_data.get("image"), image_width, image_height)
+        if cover is not None:
+            image_label.setPixmap(cover)
             image_label.setFixedSize(image_width, image_height)
         else:
             image_label.setText(game_name)
@@ -632,6 +637,23 @@ class GameSaveBackup(QMainWindow):
         
         return widget
 
+    def load_cover_pixmap(self, image_path, width, height):
+        if not image_path:
+            return None
+        
+        try:
+            mtime = os.stat(image_path).st_mtime_ns
+        except OSError:
+            return None
+        
+        # mtime is part of the key so a replaced cover image is picked up
+        key = f"cover:{image_path}:{mtime}:{width}x{height}"
+        pixmap = QPixmapCache.find(key)
+        if pixmap is None or pixmap.isNull():
+            pixmap = QPixmap(image_path).scaled(width, height, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            QPixmapCache.insert(key, pixmap)
+        return pixmap
+
     def on_game_moved(self, source_name, target_name):
         if source_name == target_name:
             return
@@ -666,6 +688,13 @@ class GameSaveBackup(QMainWindow):
         
         self.game_name_from_search = game_name
         
+        # The typed name usually is the official one, so look its save locations up on
+        # PCGamingWiki while IGDB is searched; the dialog reuses the result if the name holds
+        if self.save_dialog_prefetch:
+            self.save_dialog_prefetch.deleteLater()
+        self.save_dialog_prefetch = SaveSelectionDialog(self, game_name)
+        self.save_dialog_prefetch.prefetch_wiki_save_locations(game_name)
+        
         loading_dialog = LoadingDialog(self, f"Searching for: '{game_name}'...")
         loading_dialog.center_on_parent()
         loading_dialog.show()
@@ -754,24 +783,9 @@ class GameSaveBackup(QMainWindow):
             self.current_worker = None
     
     def continue_add_game_save(self, game_name, igdb_game_data):
-        loading_dialog = ProgressDialog(self, f"Fetching save locations for '{game_name}'")
-        loading_dialog.center_on_parent()
-        loading_dialog.show()
-        QApplication.processEvents()
-        
-        try:
-            loading_dialog.set_detail("Checking PCGamingWiki for save locations...")
-            loading_dialog.set_progress(30)
-            QApplication.processEvents()
-            suggested_paths = utils.fetch_pcgamingwiki_save_locations(game_name)
-            loading_dialog.set_progress(100)
-        except Exception as e:
-            logger.error(f"PCGamingWiki error: {str(e)}")
-            suggested_paths = {}
-        finally:
-            loading_dialog.close()
-        
-        dialog = SaveSelectionDialog(self, game_name, None, suggested_paths)
+        dialog = self.save_dialog_prefetch or SaveSelectionDialog(self, game_name)
+        self.save_dialog_prefetch = None
+        self.fetch_save_locations_into(dialog, game_name)
         if dialog.exec() != QDialog.Accepted:
             return
         
@@ -1311,22 +1325,24 @@ class GameSaveBackup(QMainWindow):
         self.update_games_list()
         QMessageBox.information(self, "Game Renamed", f"Game has been renamed to '{new_name}'.")
     
+    def fetch_save_locations_into(self, dialog, game_name):
+        # The dialog runs the PCGamingWiki lookup off the UI thread and fills its list in
+        # when it arrives, reusing any result it already has for the name
+        loading_dialog = ProgressDialog(self, f"Fetching save locations for '{game_name}'", indeterminate=True)
+        loading_dialog.center_on_parent()
+        loading_dialog.set_detail("Checking PCGamingWiki for save locations...")
+        dialog.fetch_wiki_save_locations(game_name, loading_dialog)
+    
     def edit_game_paths(self, game_name):
         game_data = self.config["games"].get(game_name)
         if not game_data:
             return
         
         logger.info(f"Editing paths for: {game_name}")
+        logger.info(f"Fetching PCGamingWiki data for: {game_name}")
         
-        try:
-            logger.info(f"Fetching PCGamingWiki data for: {game_name}")
-            suggested_paths = utils.fetch_pcgamingwiki_save_locations(game_name)
-            logger.info(f"PCGamingWiki returned {len(suggested_paths)} suggested paths")
-        except Exception as e:
-            logger.error(f"Error fetching PCGamingWiki data: {e}")
-            suggested_paths = {}
-        
-        dialog = SaveSelectionDialog(self, game_name, self.config.get("igdb_auth"), suggested_paths)
+        dialog = SaveSelectionDialog(self, game_name, self.config.get("igdb_auth"))
+        self.fetch_save_locations_into(dialog, game_name)
         if dialog.exec() != QDialog.Accepted:
             return
         
@@ -1573,7 +1589,10 @@ class GameSaveBackup(QMainWindow):
             QMessageBox.critical(self, "Error", f"Failed to copy image: {e}")
 
 def main():
+    # Skip Qt's opaque-sibling region subtraction on every child repaint (read once at startup)
+    os.environ.setdefault("QT_NO_SUBTRACTOPAQUESIBLINGS", "1")
     app = QApplication(sys.argv)
+    QPixmapCache.setCacheLimit(50 * 1024)  # KB
     
     icon_path = "icon.ico"
     app.setWindowIcon(QIcon(icon_path))
@@ -1,8 +1,9 @@
 import os
-import re
-import glob
 import urllib.parse
-import threading
+from bisect import bisect_right
+from collections import OrderedDict
+import itertools
+import functools
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QLineEdit,
     QFormLayout, QMessageBox, QListWidget, QListWidgetItem, QFileDialog,
@@ -12,13 +13,153 @@ from PySide6.QtWidgets import (
     QApplication, QProgressBar, QStyle
 )
 from PySide6.QtCore import (
-    Qt, QSize, Signal, QMimeData, QRect, QPoint, QThreadPool, QTimer, QPropertyAnimation, QEasingCurve, QObject, QPointF
+    Qt, QSize, Signal, QMimeData, QRect, QPoint, QThreadPool, QTimer, QPropertyAnimation, QEasingCurve, QObject, QPointF, Slot,
+    QAbstractListModel, QModelIndex, QStringListModel, QEvent
 )
 from PySide6.QtGui import (
-    QIcon, QDrag, QPainter, QColor, QTextDocument, QPalette, QPixmap, QPen, QPainterPath
+    QIcon, QDrag, QPainter, QColor, QBrush, QPalette, QPixmap, QPixmapCache, QImage, QPen, QPainterPath
 )
-from workers import LegacyIGDBAuthWorker, LegacyIGDBGameSearchWorker, LegacyAPITestWorker, IGDBGameSearchWorker
-from utils import get_windows_accent_color, is_windows_11_or_later
+from workers import LegacyIGDBAuthWorker, LegacyAPITestWorker, IGDB_POOL, WikiFetchWorker, SavePathProbeWorker, search_igdb_games
+from utils import get_windows_accent_color, is_windows_11_or_later, probe_path, forget_path_probe
+
+# Looked up once per session; reading it goes to the registry on Windows
+_ACCENT_COLOR = get_windows_accent_color() if is_windows_11_or_later() else "#0078d4"
+
+
+# Stylesheets shared by every instance; %ACCENT_COLOR% is filled in at use
+_SEARCH_PROGRESS_QSS = """
+    QProgressBar {
+        border: 1px solid grey;
+        border-radius: 3px;
+        text-align: center;
+        background-color: #444; /* Slightly darker background */
+    }
+    QProgressBar::chunk {
+        background-color: %ACCENT_COLOR%;
+        width: 10px; 
+        margin: 0.5px;
+    }
+"""
+
+_LOADING_QSS = """
+    QDialog {
+        background-color: %BG_COLOR%;
+        border: 1px solid #555;
+        border-radius: 8px;
+    }
+    QLabel {
+        color: %TEXT_COLOR%;
+        background-color: transparent;
+    }
+"""
+
+_TOAST_QSS = """
+    #toastContentFrame {
+        background-color: %BG_COLOR%;
+        border-radius: 6px;
+        border: 1px solid %BORDER_COLOR%;
+    }
+    QLabel {
+        color: %TEXT_COLOR%;
+        background-color: transparent;
+        font-size: 9pt;
+    }
+    #messageLabel {
+        padding-right: 3px; 
+    }
+    #closeButton {
+        background-color: transparent;
+        color: %CLOSE_COLOR%;
+        border: none;
+        font-size: 12pt;
+        font-weight: bold;
+        padding: 0px; 
+    }
+    #closeButton:hover {
+        color: %CLOSE_HOVER_COLOR%;
+    }
+"""
+
+# Keyed by whether the theme is dark
+_TOAST_COLORS = {
+    True: {
+        "%BG_COLOR%": "#2d2d2d",
+        "%TEXT_COLOR%": "#f0f0f0",
+        "%BORDER_COLOR%": "#4a4a4a",
+        "%CLOSE_COLOR%": "#a0a0a0",
+        "%CLOSE_HOVER_COLOR%": "#ffffff",
+    },
+    False: {
+        "%BG_COLOR%": "#f0f0f0",
+        "%TEXT_COLOR%": "#2d2d2d",
+        "%BORDER_COLOR%": "#c0c0c0",
+        "%CLOSE_COLOR%": "#505050",
+        "%CLOSE_HOVER_COLOR%": "#000000",
+    },
+}
+
+_PROGRESS_BAR_QSS = """
+    QProgressBar {
+        border: 1px solid %BORDER_COLOR%;
+        border-radius: 3px;
+        text-align: center;
+        background-color: %BAR_BG_COLOR%;
+        color: %BAR_TEXT_COLOR%;
+        min-height: 20px;
+    }
+    
+    QProgressBar::chunk {
+        background-color: %CHUNK_COLOR%;
+        border-radius: 3px;
+    }
+"""
+
+_CANCEL_BUTTON_QSS = """
+    QPushButton {
+        background-color: %BUTTON_BG_COLOR%;
+        color: %BUTTON_TEXT_COLOR%;
+        border: 1px solid %BORDER_COLOR%;
+        border-radius: 3px;
+        padding: 5px;
+        min-width: 80px;
+    }
+    QPushButton:hover {
+        background-color: %BUTTON_HOVER_COLOR%;
+    }
+    QPushButton:pressed {
+        background-color: %BUTTON_PRESSED_COLOR%;
+    }
+"""
+
+# Keyed by whether the theme is dark; the chunk color is added at use
+_PROGRESS_COLORS = {
+    True: {
+        "%BAR_BG_COLOR%": "#222222",
+        "%BORDER_COLOR%": "#555555",
+        "%BAR_TEXT_COLOR%": "#E0E0E0",
+        "%BUTTON_BG_COLOR%": "#333333",
+        "%BUTTON_TEXT_COLOR%": "white",
+        "%BUTTON_HOVER_COLOR%": "#444444",
+        "%BUTTON_PRESSED_COLOR%": "#222222",
+    },
+    False: {
+        "%BAR_BG_COLOR%": "#F0F0F0",
+        "%BORDER_COLOR%": "#B0B0B0",
+        "%BAR_TEXT_COLOR%": "#202020",
+        "%BUTTON_BG_COLOR%": "#E0E0E0",
+        "%BUTTON_TEXT_COLOR%": "black",
+        "%BUTTON_HOVER_COLOR%": "#D0D0D0",
+        "%BUTTON_PRESSED_COLOR%": "#C0C0C0",
+    },
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _pcgw_link_html(game_name, accent_color):
+    # PCGamingWiki uses underscores for spaces and then URL encodes.
+    pcgw_game_name_encoded = urllib.parse.quote(game_name.replace(" ", "_"))
+    page_url = f"https://www.pcgamingwiki.com/wiki/{pcgw_game_name_encoded}#Save_game_data_location" # Appended section
+    return f'<a href="{page_url}" style="color: {accent_color};">View on PCGamingWiki</a>'
 
 
 class IGDBSetupDialog(QDialog):
@@ -31,8 +172,9 @@ class IGDBSetupDialog(QDialog):
         
         self.settings = current_settings or {}
         self.auth_data = None
+        self._last_tested = (None, None, None)  # (client_id, client_secret, auth_data)
         
-        self.threadpool = QThreadPool.globalInstance()
+        self.threadpool = IGDB_POOL
         
         self.init_ui()
     
@@ -92,6 +234,12 @@ class IGDBSetupDialog(QDialog):
             QMessageBox.warning(self, "Missing Information", "Please enter both Client ID and Client Secret")
             return
         
+        last_id, last_secret, last_auth = self._last_tested
+        if (client_id, client_secret) == (last_id, last_secret) and last_auth is not None:
+            self.on_auth_complete(last_auth)
+            return
+        self._last_tested = (client_id, client_secret, None)
+        
         self.status_label.setText("Testing connection...")
         self.test_button.setEnabled(False)
         
@@ -104,6 +252,7 @@ class IGDBSetupDialog(QDialog):
     
     def on_auth_complete(self, auth_data):
         self.auth_data = auth_data
+        self._last_tested = (self._last_tested[0], self._last_tested[1], auth_data)
         self.status_label.setText("Authentication successful. Testing API connection...")
         
         worker = LegacyAPITestWorker(auth_data)
@@ -113,6 +262,8 @@ class IGDBSetupDialog(QDialog):
         self.threadpool.start(worker)
     
     def on_auth_failed(self, error_message):
+        # Failures aren't remembered so a retry after a network hiccup goes through
+        self._last_tested = (None, None, None)
         self.status_label.setText(f"Error: {error_message}")
         QMessageBox.critical(self, "Authentication Failed", error_message)
     
@@ -126,7 +277,34 @@ class IGDBSetupDialog(QDialog):
         QMessageBox.critical(self, "API Connection Failed", error_message)
 
 
+class GameResultModel(QAbstractListModel):
+    """List model backed directly by the IGDB search result dicts"""
+    def __init__(self, games=None, parent=None):
+        super().__init__(parent)
+        self._games = games or []
+    
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._games)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        
+        game = self._games[index.row()]
+        if role == Qt.DisplayRole:
+            return game["name"]
+        if role == Qt.UserRole:
+            return game
+        return None
+
+
 class GameSearchDialog(QDialog):
+    # IGDB results for this session, shared by every search dialog
+    _results_cache = OrderedDict()
+    RESULTS_CACHE_SIZE = 128
+    
     def __init__(self, parent=None, auth_data=None, game_name="", games=None, allow_custom_name=False):
         super().__init__(parent)
         self.setWindowTitle(f"Search for {game_name}")
@@ -139,8 +317,6 @@ class GameSearchDialog(QDialog):
         self.precached_games = games
         self.allow_custom_name = allow_custom_name
         
-        self.threadpool = QThreadPool.globalInstance()
-        
         self.init_ui()
         
         if not self.precached_games:
@@ -158,25 +334,13 @@ class GameSearchDialog(QDialog):
         self.loading_indicator.setRange(0, 0)  # Indeterminate
         self.loading_indicator.setTextVisible(False)
         self.loading_indicator.setFixedHeight(8)
-        accent_color = get_windows_accent_color() if is_windows_11_or_later() else "#0078d4"
-        self.loading_indicator.setStyleSheet(f"""
-            QProgressBar {{
-                border: 1px solid grey;
-                border-radius: 3px;
-                text-align: center;
-                background-color: #444; /* Slightly darker background */
-            }}
-            QProgressBar::chunk {{
-                background-color: {accent_color};
-                width: 10px; 
-                margin: 0.5px;
-            }}
-        """)
+        self.loading_indicator.setStyleSheet(_SEARCH_PROGRESS_QSS.replace("%ACCENT_COLOR%", _ACCENT_COLOR))
         self.loading_indicator.setVisible(True)  # Initially hidden
         layout.addWidget(self.loading_indicator)
         
-        self.game_list = QListWidget()
-        self.game_list.itemClicked.connect(self.on_game_selected)
+        self.game_list = QListView()
+        self.game_list.clicked.connect(self.on_game_selected)
+        self.game_list.doubleClicked.connect(self.accept)
         layout.addWidget(self.game_list)
         
         if self.allow_custom_name:
@@ -212,16 +376,25 @@ class GameSearchDialog(QDialog):
     def search_game(self):
         self.status_label.setText(f"Searching for '{self.game_name}'...")
         self.loading_indicator.setVisible(True)
-        if self.auth_data:
-            worker = LegacyIGDBGameSearchWorker(self.auth_data, self.game_name)
-        else:
-            from workers import IGDBGameSearchWorker
-            worker = IGDBGameSearchWorker(self.game_name)
-            
-        worker.signals.search_complete.connect(self.on_search_complete)
-        worker.signals.search_failed.connect(self.on_search_failed)
         
-        self.threadpool.start(worker)
+        cache_key = (self.auth_data.get("client_id") if self.auth_data else None, self.game_name.strip().lower())
+        cached_games = self._results_cache.get(cache_key)
+        if cached_games is not None:
+            self._results_cache.move_to_end(cache_key)
+            self.on_search_complete(cached_games)
+            return
+        
+        search_igdb_games(self.auth_data, self.game_name,
+                          lambda games: self.on_search_results(cache_key, games),
+                          self.on_search_failed, self)
+    
+    def on_search_results(self, cache_key, games):
+        if games: # An empty result may be a transient API hiccup, so ask again next time
+            self._results_cache[cache_key] = games
+            self._results_cache.move_to_end(cache_key)
+            if len(self._results_cache) > self.RESULTS_CACHE_SIZE:
+                self._results_cache.popitem(last=False)
+        self.on_search_complete(games)
     
     def on_search_complete(self, games):
         self.loading_indicator.setVisible(False)
@@ -235,14 +408,10 @@ class GameSearchDialog(QDialog):
             return
         
         self.status_label.setText(f"Found {len(games)} results for '{self.game_name}'")
-        self.game_list.clear()
-        
-        for game in games:
-            item = QListWidgetItem(game["name"])
-            item.setData(Qt.UserRole, game)
-            self.game_list.addItem(item)
-        
-        self.game_list.itemDoubleClicked.connect(self.accept)
+        old_model = self.game_list.model()
+        self.game_list.setModel(GameResultModel(games, self))
+        if old_model is not None:
+            old_model.deleteLater()
 
     def on_search_failed(self, error_message):
         self.loading_indicator.setVisible(False)
@@ -252,41 +421,34 @@ class GameSearchDialog(QDialog):
             self.custom_name_checkbox.setChecked(True)
             self.toggle_custom_name(True)
     
-    def on_game_selected(self, item):
-        self.selected_game = item.data(Qt.UserRole)
+    def on_game_selected(self, index):
+        self.selected_game = index.data(Qt.UserRole)
         
         if not hasattr(self, 'custom_name_checkbox') or not self.custom_name_checkbox.isChecked():
             self.select_button.setEnabled(True)
 
 
 class LoadingDialog(QDialog):
+    _stylesheet = None # Filled in from the application theme on first use
+    
     def __init__(self, parent=None, message="Loading..."):
         super().__init__(parent)
         self.setWindowTitle("Please wait")
         self.setFixedSize(400, 150)
         self.setWindowFlag(Qt.WindowType.FramelessWindowHint)
         self.setModal(True)
-        palette = self.parent().palette() if self.parent() else QApplication.palette()
-        is_dark_theme = palette.color(QPalette.ColorRole.Window).value() < 128
         
-        if is_dark_theme:
-            bg_color = "#222222" # Dark background
-            text_color = "#ffffff"
-        else: # Light Mode
-            bg_color = "#bbbbbb"
-            text_color = "#000000"
-        
-        self.setStyleSheet("""
-            QDialog {
-                background-color: {bg_color};
-                border: 1px solid #555;
-                border-radius: 8px;
-            }
-            QLabel {
-                color: {text_color};
-                background-color: transparent;
-            }
-        """)
+        if LoadingDialog._stylesheet is None:
+            is_dark_theme = QApplication.palette().color(QPalette.ColorRole.Window).value() < 128
+            if is_dark_theme:
+                bg_color = "#222222" # Dark background
+                text_color = "#ffffff"
+            else: # Light Mode
+                bg_color = "#bbbbbb"
+                text_color = "#000000"
+            LoadingDialog._stylesheet = _LOADING_QSS.replace("%BG_COLOR%", bg_color).replace("%TEXT_COLOR%", text_color)
+        
+        self.setStyleSheet(LoadingDialog._stylesheet)
         
         layout = QVBoxLayout(self)
         layout.setContentsMargins(20, 20, 20, 20)
@@ -317,9 +479,39 @@ class LoadingDialog(QDialog):
             x = parent_pos.x() + (parent_pos.width() - self.width()) // 2
             y = parent_pos.y() + (parent_pos.height() - self.height()) // 2
             self.move(x, y)
+    
+    def show_delayed(self, delay_ms=150):
+        """Show the dialog only if the work it waits on is still running after delay_ms"""
+        self._show_pending = True
+        QTimer.singleShot(delay_ms, self._show_if_pending) # closeEvent clears the pending flag
+    
+    def _show_if_pending(self):
+        if getattr(self, '_show_pending', False):
+            self._show_pending = False
+            self.show()
+    
+    def closeEvent(self, event):
+        self._show_pending = False
+        super().closeEvent(event)
 
 
 class SaveSelectionDialog(QDialog):
+    # Row colors for the suggested paths table
+    COLOR_USABLE = QColor("#c9deff")
+    COLOR_PLACEHOLDER = QColor("orange")
+    COLOR_PATTERN = QColor("red")
+    COLOR_PARENT_ONLY = QColor("darkgray")
+    COLOR_OTHER = QColor("gray")
+    COLOR_EMPTY = QColor(128, 128, 128)
+    KIND_COLORS = {
+        "usable": COLOR_USABLE,
+        "placeholder": COLOR_PLACEHOLDER,
+        "pattern": COLOR_PATTERN,
+        "parent_only": COLOR_PARENT_ONLY, # Missing, but its parent folder exists
+        "other": COLOR_OTHER,
+    }
+    _ok_icon = None # Theme lookup needs the application, so it happens on first use
+    
     def __init__(self, parent=None, game_name="", auth_data=None, suggested_paths=None, existing_cover_art_path=None): # Added existing_cover_art_path
         super().__init__(parent)
         self.setWindowTitle("Game Save Selection")
@@ -334,6 +526,8 @@ class SaveSelectionDialog(QDialog):
         self.threadpool = QThreadPool.globalInstance()
         self.existing_cover_art_path = existing_cover_art_path
         self.custom_cover_art_path = None
+        self._wiki_cache = {}  # normalized game name -> (paths, resolved items)
+        self._wiki_pending = {}  # normalized game name -> loading dialogs waiting on the fetch
         
         self.init_ui()
         if self.game_name: # Update PCGW link if game name is initialised
@@ -414,17 +608,19 @@ class SaveSelectionDialog(QDialog):
         
         self.paths_table = QListWidget()
         self.paths_table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
-        self.paths_table.setItemDelegate(HTMLDelegate(self.paths_table)) # Pass parent to delegate
         self.paths_table.setMinimumHeight(100) 
         self.paths_table.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)  
         self.paths_table.setAlternatingRowColors(True)
-        self.paths_table.setStyleSheet("""
-            QListWidget::item { padding: 4px; }
-            QListWidget::item:selected { 
-                background-color: %ACCENT_COLOR%; 
-                color: white; 
-            }
-        """.replace("%ACCENT_COLOR%", get_windows_accent_color() if is_windows_11_or_later() else "#0078d4"))
+        # Selection colors through the palette, so the list stays off the stylesheet engine
+        paths_palette = self.paths_table.palette()
+        paths_palette.setColor(QPalette.Highlight, QColor(_ACCENT_COLOR))
+        paths_palette.setColor(QPalette.HighlightedText, QColor("white"))
+        self.paths_table.setPalette(paths_palette)
+        self.paths_table.setSpacing(2)
+        # Every row is a single line in the same font, so the view can skip per-row measuring
+        self.paths_table.setUniformItemSizes(True)
+        self.paths_table.setLayoutMode(QListView.Batched)
+        self.paths_table.setBatchSize(50)
         self.paths_table.itemDoubleClicked.connect(self.use_suggested_path)
         
         options_and_paths_layout.addWidget(self.paths_table)
@@ -455,16 +651,14 @@ class SaveSelectionDialog(QDialog):
         # Initial population of paths_table (will be empty if no initial suggested_paths)
         # The actual population happens in update_suggested_paths
         if self.suggested_paths_templates:
-             # Call a non-UI blocking update, or ensure fetch_... then update_... is called
-             # For now, let's assume initial population if data is present.
-             # This might need to be async if paths_dict comes from a slow source initially.
-             # The current flow is: init_ui, then if game_name, fetch happens, then update_suggested_paths.
-             # If no game_name, search_game_name -> fetch -> update.
-             # So, direct population here might be premature or use self.suggested_paths_templates
-             self.update_suggested_paths(self.suggested_paths_templates, None) # Pass None for loading_dialog if not applicable here
+            # Resolve the templates off the GUI thread; the table fills in when the probe finishes
+            worker = SavePathProbeWorker(self.suggested_paths_templates)
+            worker.signals.save_locations_fetched.connect(
+                lambda paths, items: self.update_suggested_paths(paths, None, items))
+            self.threadpool.start(worker)
         else:
             item = QListWidgetItem("No suggested paths available or game not specified.")
-            item.setForeground(QColor(128, 128, 128))
+            item.setForeground(self.COLOR_EMPTY)
             item.setTextAlignment(Qt.AlignCenter)
             self.paths_table.addItem(item)
             self.paths_table.setEnabled(False)
@@ -478,11 +672,7 @@ class SaveSelectionDialog(QDialog):
 
     def update_pcgw_link(self):
         if self.game_name:
-            # PCGamingWiki uses underscores for spaces and then URL encodes.
-            pcgw_game_name = self.game_name.replace(" ", "_")
-            pcgw_game_name_encoded = urllib.parse.quote(pcgw_game_name)
-            page_url = f"https://www.pcgamingwiki.com/wiki/{pcgw_game_name_encoded}#Save_game_data_location" # Appended section
-            self.pcgw_link_label.setText(f'<a href="{page_url}" style="color: {get_windows_accent_color() if is_windows_11_or_later() else "#0078d4"};">View on PCGamingWiki</a>')
+            self.pcgw_link_label.setText(_pcgw_link_html(self.game_name, _ACCENT_COLOR))
             self.pcgw_link_label.setVisible(True)
         else:
             self.pcgw_link_label.setVisible(False)
@@ -525,16 +715,22 @@ class SaveSelectionDialog(QDialog):
 
         loading_dialog = LoadingDialog(self, f"Searching for save locations for '{self.game_name}'")
         loading_dialog.center_on_parent()
-        loading_dialog.show()
-        QApplication.processEvents()
+        loading_dialog.show_delayed() # Fast or cached lookups finish before it would flash up
         
         if self.auth_data:
-            worker = LegacyIGDBGameSearchWorker(self.auth_data, game_name_to_search)
-            worker.signals.search_complete.connect(lambda games: self.on_search_complete(games, loading_dialog))
-            worker.signals.search_failed.connect(lambda _: self.fetch_wiki_save_locations(game_name_to_search, loading_dialog))
-            worker.signals.finished.connect(lambda: self.game_name_input_search.setEnabled(True))
+            def on_igdb_complete(games):
+                if hasattr(self, 'game_name_input_search'):
+                    self.game_name_input_search.setEnabled(True)
+                self.on_search_complete(games, loading_dialog)
             
-            self.threadpool.start(worker)
+            def on_igdb_failed(_):
+                if hasattr(self, 'game_name_input_search'):
+                    self.game_name_input_search.setEnabled(True)
+                self.fetch_wiki_save_locations(game_name_to_search, loading_dialog)
+            
+            search_igdb_games(self.auth_data, game_name_to_search, on_igdb_complete, on_igdb_failed, self)
+            # The typed name usually is the official one, so look it up on PCGamingWiki meanwhile
+            self.prefetch_wiki_save_locations(game_name_to_search)
         else:
             self.fetch_wiki_save_locations(game_name_to_search, loading_dialog)
 
@@ -580,30 +776,47 @@ class SaveSelectionDialog(QDialog):
             # self.progress_dialog_status.show() # Or manage its visibility as needed
 
         self.game_name = game_name # Ensure self.game_name is current
+        if hasattr(self, 'game_name_label'): # IGDB may have resolved a different name
+            self.game_name_label.setText(f"<h2>{self.game_name}</h2>")
         self.update_pcgw_link() # Update link with current game_name
 
-        loading_dialog.setVisible(True)
-        loading_dialog.raise_()
-        QApplication.processEvents()  
+        if loading_dialog.isVisible():
+            loading_dialog.raise_()
+        else:
+            loading_dialog.show_delayed()
+        
+        cache_key = game_name.strip().lower()
+        if cache_key in self._wiki_cache:
+            paths, items = self._wiki_cache[cache_key]
+            QTimer.singleShot(0, lambda: self.update_suggested_paths(paths, loading_dialog, items))
+            return
         
+        if cache_key in self._wiki_pending: # Already being fetched, e.g. by the prefetch
+            self._wiki_pending[cache_key].append(loading_dialog)
+            return
         
-        def fetch_thread():
-            from utils import fetch_pcgamingwiki_save_locations
-            paths = fetch_pcgamingwiki_save_locations(game_name)
-            
-            from PySide6.QtCore import QMetaObject, Qt, Q_ARG, QObject
-            QMetaObject.invokeMethod(
-                self, "update_suggested_paths", 
-                Qt.ConnectionType.QueuedConnection,
-                Q_ARG(QObject, paths),
-                Q_ARG(QObject, loading_dialog)
-            )
-        
-        thread = threading.Thread(target=fetch_thread)
-        thread.daemon = True
-        thread.start()
-    
-    def update_suggested_paths(self, paths_dict, loading_dialog):
+        self._start_wiki_fetch(game_name, cache_key, [loading_dialog])
+    
+    def prefetch_wiki_save_locations(self, game_name):
+        cache_key = game_name.strip().lower()
+        if cache_key not in self._wiki_cache and cache_key not in self._wiki_pending:
+            self._start_wiki_fetch(game_name, cache_key, [])
+    
+    def _start_wiki_fetch(self, game_name, cache_key, waiting_dialogs):
+        self._wiki_pending[cache_key] = waiting_dialogs
+        worker = WikiFetchWorker(game_name)
+        worker.signals.save_locations_fetched.connect(
+            lambda paths, items: self.on_wiki_fetch_complete(cache_key, paths, items))
+        
+        self.threadpool.start(worker)
+    
+    def on_wiki_fetch_complete(self, cache_key, paths, items):
+        if paths: # Don't remember failed or empty lookups so a retry can still succeed
+            self._wiki_cache[cache_key] = (paths, items)
+        for loading_dialog in self._wiki_pending.pop(cache_key, []):
+            self.update_suggested_paths(paths, loading_dialog, items)
+    
+    def update_suggested_paths(self, paths_dict, loading_dialog, resolved_items):
         if loading_dialog: # Can be None if called from init_ui
             loading_dialog.close()
         
@@ -614,57 +827,40 @@ class SaveSelectionDialog(QDialog):
             # If it's meant to persist with a new message, update its message instead.
             pass # Decide on behavior: close, hide, or update message
 
+        # Enable proceed button if game name is known, regardless of path usability
+        current_game_name = ""
+        if self.game_name: # Prioritize self.game_name
+            current_game_name = self.game_name
+        elif hasattr(self, 'game_name_input_search') and self.game_name_input_search.text().strip():
+            current_game_name = self.game_name_input_search.text().strip()
+        elif hasattr(self, 'game_name_input_edit') and self.game_name_input_edit.text().strip(): # Check edit field too
+            current_game_name = self.game_name_input_edit.text().strip()
+
+
+        if current_game_name:
+            self.proceed_button.setEnabled(True)
+            if hasattr(self, 'edit_game_name_button'):
+                self.edit_game_name_button.setEnabled(True)
+        else:
+            self.proceed_button.setEnabled(False)
+            if hasattr(self, 'edit_game_name_button'):
+                self.edit_game_name_button.setEnabled(False)
+
+        # Retrying a search usually yields the same suggestions; keep the table as it is then
+        sig = (
+            tuple(sorted(paths_dict.items())),
+            tuple((data["path"], data.get("exists")) for data in resolved_items)
+        )
+        if sig == getattr(self, '_last_paths_sig', None):
+            return
+        self._last_paths_sig = sig
+
         self.suggested_paths_templates = paths_dict # Store original templates
         self.paths_table.clear()
         
-        all_items_for_table = [] 
-
-        for store_type, path_template in paths_dict.items():
-            path_template = re.sub(r"&lt;[^>]+&gt;", "*", path_template)
-            expanded_path_template = os.path.expandvars(path_template)
-            expanded_path_template = os.path.expanduser(expanded_path_template)
-            print(f"Expanded path template: {expanded_path_template}") # Debugging line
-
-            if "*" in expanded_path_template:
-                try:
-                    # Ensure the base directory for glob exists if pattern is like "base_dir/*"
-                    glob_base = os.path.dirname(expanded_path_template)
-                    if not os.path.exists(glob_base) and "*" not in glob_base : # only glob if base exists or base itself is a pattern
-                         all_items_for_table.append({
-                            "store": store_type, "path": expanded_path_template, "original_template": path_template,
-                            "display_text": f"<b>{store_type} (pattern, base missing):</b> {expanded_path_template}",
-                            "exists": False, "is_pattern_base_missing": True
-                        })
-                         continue
-
-                    matches = glob.glob(expanded_path_template, recursive=False) 
-                    if matches:
-                        for match_path in matches:
-                            is_dir = os.path.isdir(match_path)
-                            all_items_for_table.append({
-                                "store": store_type, "path": match_path, "original_template": path_template,
-                                "display_text": f"<b>{store_type} (match):</b> {match_path}",
-                                "exists": True, 
-                                "is_dir": is_dir
-                            })
-                except Exception as e: 
-                    print(f"Error globbing {expanded_path_template}: {e}")
-                    all_items_for_table.append({
-                        "store": store_type, "path": expanded_path_template, "original_template": path_template,
-                        "display_text": f"<b>{store_type} (pattern, error):</b> {expanded_path_template}",
-                        "exists": False, "is_pattern_error": True
-                    })
-            else: 
-                path_exists = os.path.exists(expanded_path_template)
-                parent_exists = os.path.exists(os.path.dirname(expanded_path_template))
-                if path_exists or parent_exists: # Add if path or its parent exists
-                     all_items_for_table.append({
-                        "store": store_type, "path": expanded_path_template, "original_template": path_template,
-                        "display_text": f"<b>{store_type}:</b> {expanded_path_template}",
-                        "exists": path_exists,
-                        "is_dir": os.path.isdir(expanded_path_template) if path_exists else None
-                    })
-        
+        # Path expansion and existence checks were already done by the worker
+        all_items_for_table = resolved_items
+
         has_directly_usable_paths = False
         if not all_items_for_table:
             item_text = "No suggested paths found or resolved."
@@ -672,7 +868,7 @@ class SaveSelectionDialog(QDialog):
                 item_text = "No suggestions provided by source."
 
             item = QListWidgetItem(item_text)
-            item.setForeground(QColor(128, 128, 128))
+            item.setForeground(self.COLOR_EMPTY)
             item.setTextAlignment(Qt.AlignCenter)
             self.paths_table.addItem(item)
             self.paths_table.setEnabled(False)
@@ -682,37 +878,37 @@ class SaveSelectionDialog(QDialog):
                 self.progress_dialog_status.set_message(item_text)
                 # self.progress_dialog_status.close() # Or hide, if it's no longer needed
         else:
-            for data in all_items_for_table:
-                item = QListWidgetItem()
-                # Using setToolTip to show the original template for clarity
-                item.setToolTip(f"Original template: {data['original_template']}\nResolved path: {data['path']}")
+            if SaveSelectionDialog._ok_icon is None:
+                SaveSelectionDialog._ok_icon = QIcon.fromTheme("dialog-ok") or QIcon()
+            ok_icon = SaveSelectionDialog._ok_icon
+            bold_font = self.paths_table.font()
+            bold_font.setBold(True)
+            
+            # Fill the table in one go instead of repainting after every row
+            self.paths_table.setUpdatesEnabled(False)
+            self.paths_table.blockSignals(True)
+            try:
+                for data in all_items_for_table:
+                    item = QListWidgetItem()
+                    # Using setToolTip to show the original template for clarity
+                    item.setToolTip(f"Original template: {data['original_template']}\nResolved path: {data['path']}")
                 
-                # For HTMLDelegate to work, text must be set via setText.
-                # If HTMLDelegate is not used, <b> tags won't render.
-                # Assuming HTMLDelegate is active as per previous setup.
-                item.setText(data["display_text"]) 
+                    item.setText(data["display_text"])
+                    item.setFont(bold_font)
                 
-                item_is_directly_usable = data.get("exists", False) and \
-                                          not data.get("is_placeholder") and \
-                                          not data.get("is_pattern_no_match") and \
-                                          not data.get("is_pattern_error") and \
-                                          not data.get("is_pattern_base_missing")
-
-                if item_is_directly_usable:
-                    item.setForeground(QColor("#c9deff")) 
-                    item.setIcon(QIcon.fromTheme("dialog-ok") or QIcon()) 
-                    has_directly_usable_paths = True
-                elif data.get("is_placeholder"):
-                    item.setForeground(QColor("orange")) 
-                elif data.get("is_pattern_no_match") or data.get("is_pattern_error") or data.get("is_pattern_base_missing"):
-                    item.setForeground(QColor("red")) 
-                elif data.get("exists") is False and os.path.exists(os.path.dirname(data["path"])): # Parent exists
-                    item.setForeground(QColor("darkgray")) # Exists: False, but parent_exists = True
-                else: 
-                    item.setForeground(QColor("gray")) 
+                    # The worker already classified the entry (see utils._save_path_kind)
+                    kind = data.get("kind", "other")
+                    item.setForeground(self.KIND_COLORS[kind])
+                    if kind == "usable":
+                        item.setIcon(ok_icon) 
+                        has_directly_usable_paths = True
                 
-                item.setData(Qt.UserRole, data)
-                self.paths_table.addItem(item)
+                    item.setData(Qt.UserRole, data)
+                    self.paths_table.addItem(item)
+            finally:
+                self.paths_table.blockSignals(False)
+                self.paths_table.setUpdatesEnabled(True)
+                self.paths_table.viewport().update()
 
             current_status_text = ""
             if has_directly_usable_paths:
@@ -741,26 +937,6 @@ class SaveSelectionDialog(QDialog):
                  # This case should ideally not be hit if status_label is always created when game_name_input is.
                  print("Warning: progress_dialog_status not found where expected.")
 
-
-        # Enable proceed button if game name is known, regardless of path usability
-        current_game_name = ""
-        if self.game_name: # Prioritize self.game_name
-            current_game_name = self.game_name
-        elif hasattr(self, 'game_name_input_search') and self.game_name_input_search.text().strip():
-            current_game_name = self.game_name_input_search.text().strip()
-        elif hasattr(self, 'game_name_input_edit') and self.game_name_input_edit.text().strip(): # Check edit field too
-            current_game_name = self.game_name_input_edit.text().strip()
-
-
-        if current_game_name:
-            self.proceed_button.setEnabled(True)
-            if hasattr(self, 'edit_game_name_button'):
-                self.edit_game_name_button.setEnabled(True)
-        else:
-            self.proceed_button.setEnabled(False)
-            if hasattr(self, 'edit_game_name_button'):
-                self.edit_game_name_button.setEnabled(False)
-
     def use_suggested_path(self, item):
         path_data = item.data(Qt.UserRole)
         if not path_data:
@@ -770,7 +946,10 @@ class SaveSelectionDialog(QDialog):
         
         if path_data.get("exists"): 
             self.selected_paths = [path]
-            if path_data.get("is_dir", os.path.isdir(path)): 
+            is_dir = path_data.get("is_dir")
+            if is_dir is None: # Only stat when the probe didn't record it
+                is_dir = probe_path(path)[1]
+            if is_dir: 
                 self.directory_option.setChecked(True)
             else:
                 self.files_option.setChecked(True)
@@ -782,8 +961,7 @@ class SaveSelectionDialog(QDialog):
             QMessageBox.information(self, "Suggestion Type", 
                                     f"This suggestion is a template or pattern and cannot be used directly:\n{path}\n\nOriginal: {path_data.get('original_template', 'N/A')}\n\nPlease use 'Proceed' for manual selection if this path needs interpretation.")
         else: # Path does not exist, not a placeholder/pattern. Try to create if parent exists.
-            parent_dir = os.path.dirname(path)
-            if os.path.exists(parent_dir):
+            if path_data.get("parent_exists"):
                 msg = QMessageBox(self)
                 msg.setWindowTitle("Path Not Found")
                 msg.setText(f"The suggested path does not exist:\n{path}")
@@ -794,13 +972,26 @@ class SaveSelectionDialog(QDialog):
                 result = msg.exec()
                 
                 if result == QMessageBox.Yes:
+                    # Single mkdir attempt; the parent was probed when the list was built
                     try:
-                        os.makedirs(path, exist_ok=True) # Create directory
-                        self.selected_paths = [path]
-                        self.directory_option.setChecked(True) # Assume it's a directory if we created it
-                        self.accept()
-                    except Exception as e:
+                        os.mkdir(path)
+                    except FileExistsError:
+                        if not os.path.isdir(path): # Something else took the name since the probe
+                            forget_path_probe(path)
+                            QMessageBox.critical(self, "Error", f"Failed to create directory: a file already exists at\n{path}")
+                            return
+                    except FileNotFoundError:
+                        forget_path_probe(os.path.dirname(path))
+                        QMessageBox.warning(self, "Path Not Available", 
+                                            f"The parent directory no longer exists:\n{path}\n\nPlease select a different location or define manually.")
+                        return
+                    except OSError as e:
                         QMessageBox.critical(self, "Error", f"Failed to create directory: {e}")
+                        return
+                    forget_path_probe(path)
+                    self.selected_paths = [path]
+                    self.directory_option.setChecked(True) # Assume it's a directory if we created it
+                    self.accept()
                 # If No or Cancel, do nothing, user can proceed manually
             else: # Parent also doesn't exist
                 QMessageBox.warning(self, "Path Not Available", 
@@ -864,14 +1055,20 @@ class FlowLayout(QLayout):
         self.setSpacing(spacing)
         
         self.item_list = []
+        self._hfw_cache = OrderedDict()  # width -> height, most recent last
+        self._min_size = None
     
     def __del__(self):
         item = self.takeAt(0)
         while item:
             item = self.takeAt(0)
     
+    HFW_CACHE_SIZE = 16
+    
     def addItem(self, item):
         self.item_list.append(item)
+        self._hfw_cache.clear()
+        self._min_size = None
     
     def count(self):
         return len(self.item_list)
@@ -883,6 +1080,8 @@ class FlowLayout(QLayout):
     
     def takeAt(self, index):
         if 0 <= index < len(self.item_list):
+            self._hfw_cache.clear()
+            self._min_size = None
             return self.item_list.pop(index)
         return None
     
@@ -893,9 +1092,22 @@ class FlowLayout(QLayout):
         return True
     
     def heightForWidth(self, width):
+        height = self._hfw_cache.get(width)
+        if height is not None:
+            self._hfw_cache.move_to_end(width)
+            return height
+        
         height = self.do_layout(QRect(0, 0, width, 0), True)
+        self._hfw_cache[width] = height
+        if len(self._hfw_cache) > self.HFW_CACHE_SIZE:
+            self._hfw_cache.popitem(last=False)
         return height
     
+    def invalidate(self):
+        self._hfw_cache.clear()
+        self._min_size = None
+        super(FlowLayout, self).invalidate()
+    
     def setGeometry(self, rect):
         super(FlowLayout, self).setGeometry(rect)
         self.do_layout(rect, False)
@@ -904,137 +1116,237 @@ class FlowLayout(QLayout):
         return self.minimumSize()
     
     def minimumSize(self):
-        size = QSize()
+        if self._min_size is not None:
+            return self._min_size
         
+        max_w = max_h = 0
         for item in self.item_list:
-            size = size.expandedTo(item.minimumSize())
+            size = item.minimumSize()
+            w = size.width()
+            h = size.height()
+            if w > max_w:
+                max_w = w
+            if h > max_h:
+                max_h = h
             
         margin = self.contentsMargins()
-        size += QSize(2 * margin.left(), 2 * margin.top())
-        return size
+        self._min_size = QSize(max_w + 2 * margin.left(), max_h + 2 * margin.top())
+        return self._min_size
     
     def do_layout(self, rect, test_only=False):
-        x = rect.x()
-        y = rect.y()
+        left = x = rect.x()
+        top = y = rect.y()
+        right = rect.right()
         line_height = 0
         spacing = self.spacing()
         
+        # Spacing is the same for every tile, so ask the style once per pass
+        style = self.parentWidget().style() if self.parentWidget() else QApplication.style()
+        space_x = style.layoutSpacing(
+            QSizePolicy.PushButton, QSizePolicy.PushButton, Qt.Horizontal
+        ) or spacing
+        space_y = style.layoutSpacing(
+            QSizePolicy.PushButton, QSizePolicy.PushButton, Qt.Vertical
+        ) or spacing
+        
         for item in self.item_list:
-            style = item.widget().style()
-            layout_spacing_x = style.layoutSpacing(
-                QSizePolicy.PushButton, QSizePolicy.PushButton, Qt.Horizontal
-            ) or spacing
-            layout_spacing_y = style.layoutSpacing(
-                QSizePolicy.PushButton, QSizePolicy.PushButton, Qt.Vertical
-            ) or spacing
+            hint = item.sizeHint()
+            width = hint.width()
             
-            space_x = layout_spacing_x
-            space_y = layout_spacing_y
-            
-            next_x = x + item.sizeHint().width() + space_x
-            if next_x - space_x > rect.right() and line_height > 0:
-                x = rect.x()
+            if x + width > right and line_height > 0:
+                x = left
                 y = y + line_height + space_y
-                next_x = x + item.sizeHint().width() + space_x
                 line_height = 0
                 
             if not test_only:
-                item.setGeometry(QRect(QPoint(x, y), item.sizeHint()))
+                item.setGeometry(QRect(QPoint(x, y), hint))
                 
-            x = next_x
-            line_height = max(line_height, item.sizeHint().height())
+            x += width + space_x
+            height = hint.height()
+            if height > line_height:
+                line_height = height
             
-        return y + line_height - rect.y()
+        return y + line_height - top
 
 
 class DraggableWidget(QWidget):
     """Custom widget that supports drag & drop for game reordering with visual feedback"""
     game_moved = Signal(str, str)
+    _drag_pixmap_ids = itertools.count()
     
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setAcceptDrops(True)
         self.drag_indicator = None
-        self.drop_indicator = QWidget(self)
-        self.drop_indicator.setFixedWidth(2)
-        accent_color = get_windows_accent_color() if is_windows_11_or_later() else "#0078d4"
-        self.drop_indicator.setStyleSheet(f"background-color: {accent_color};")
-        self.drop_indicator.hide()
+        self.drop_indicator = None # Created on the first drag that needs it
+        self._owns_override = False
+        self._game_tiles = []
+        self._row_tops = []
+        self._tile_rows = []
+        self._last_drop_pos = None
+        self._last_indicator_rect = None
+        self._drag_source_rect = None
+        self._pending_drop_pos = None
+        self._move_timer = QTimer(self)
+        self._move_timer.setSingleShot(True)
+        self._move_timer.setInterval(0)
+        self._move_timer.timeout.connect(self._process_pending_move)
     
     def dragEnterEvent(self, event):
         if event.mimeData().hasText():
             event.accept()
+            # Tiles don't move while a drag is in progress, so snapshot them once
+            self._rebuild_tile_cache()
+            self._last_drop_pos = None
+            if self.drop_indicator is not None:
+                # Tiles added since the last drag stack above the indicator
+                self.drop_indicator.raise_()
             self.showDropIndicator(event.pos())
             event.acceptProposedAction()
-            QApplication.changeOverrideCursor(Qt.DragMoveCursor)
+            if not self._owns_override:
+                QApplication.setOverrideCursor(Qt.DragMoveCursor)
+                self._owns_override = True
         else:
             event.ignore()
     
     def dragMoveEvent(self, event):
         if event.mimeData().hasText():
             event.accept()
-            self.showDropIndicator(event.pos())
+            # Only the latest position of a burst of moves matters
+            self._pending_drop_pos = event.pos()
+            if not self._move_timer.isActive():
+                self._move_timer.start()
         else:
             event.ignore()
     
     def dragLeaveEvent(self, event):
-        self.drop_indicator.hide()
-        QApplication.restoreOverrideCursor()
+        self._move_timer.stop()
+        self.hide_drop_indicator()
+        self.release_override_cursor()
         event.accept()
     
     def dropEvent(self, event):
-        self.drop_indicator.hide()
-        QApplication.restoreOverrideCursor()
+        self._move_timer.stop()
+        self.hide_drop_indicator()
+        self.release_override_cursor()
         if event.source():
             event.source().unsetCursor()
         source_name = event.mimeData().text()
-        target_widget = self.childAt(event.position().toPoint())
+        pos = event.position().toPoint()
         
-        if target_widget and isinstance(target_widget, QWidget):
-            while target_widget and not target_widget.property("game_name"):
-                target_widget = target_widget.parent()
-            
-            if target_widget:
-                target_name = target_widget.property("game_name")
-                if source_name and target_name and source_name != target_name:
-                    self.game_moved.emit(source_name, target_name)
+        # Dropping a tile back onto itself is a no-op
+        if not source_name or (self._drag_source_rect is not None and self._drag_source_rect.contains(pos)):
+            event.accept()
+            return
+        
+        tile = self._tile_at(pos)
+        if tile:
+            target_name = tile[2]
+            if target_name and source_name != target_name:
+                self.game_moved.emit(source_name, target_name)
         
         event.accept()
     
+    def release_override_cursor(self):
+        if self._owns_override:
+            QApplication.restoreOverrideCursor()
+            self._owns_override = False
+    
+    def hide_drop_indicator(self):
+        if self.drop_indicator is not None:
+            self.drop_indicator.hide()
+    
+    def _rebuild_tile_cache(self):
+        self._game_tiles = []
+        layout = self.layout()
+        if layout is None:
+            return
+        for i in range(layout.count()):
+            widget = layout.itemAt(i).widget()
+            if widget and widget.property("game_name"):
+                rect = widget.geometry()
+                # Integer midpoint that splits odd widths the same way as x + width / 2
+                center_x = rect.x() + (rect.width() + 1) // 2
+                indicator_rect = QRect(rect.x() - 1, rect.y(), 2, rect.height())
+                self._game_tiles.append((rect, widget, widget.property("game_name"), center_x, indicator_rect))
+        
+        # FlowLayout puts every tile of a row at the same y, so group tiles into rows
+        # and binary search the row before scanning its handful of tiles
+        rows = {}
+        for tile in self._game_tiles:
+            rows.setdefault(tile[0].y(), []).append(tile)
+        self._row_tops = sorted(rows)
+        self._tile_rows = [rows[top] for top in self._row_tops]
+    
+    def _tile_at(self, pos):
+        row_index = bisect_right(self._row_tops, pos.y()) - 1
+        if row_index < 0:
+            return None
+        for tile in self._tile_rows[row_index]:
+            if tile[0].contains(pos):
+                return tile
+        return None
+    
+    def _paint_drop_indicator(self, event):
+        painter = QPainter(self.drop_indicator)
+        painter.fillRect(self.drop_indicator.rect(), self._drop_indicator_color)
+        painter.end()
+    
+    def _process_pending_move(self):
+        if self._pending_drop_pos is not None:
+            self.showDropIndicator(self._pending_drop_pos)
+    
     def showDropIndicator(self, pos):
-        target_widget = self.childAt(pos)
-        if target_widget and isinstance(target_widget, QWidget):
-            while target_widget and not target_widget.property("game_name"):
-                target_widget = target_widget.parent()
+        if pos == self._last_drop_pos:
+            return
+        self._last_drop_pos = pos
+        
+        tile = self._tile_at(pos)
+        if tile:
+            center_x, indicator_rect = tile[3], tile[4]
             
-            if target_widget:
-                target_pos = target_widget.pos()
-                target_center = target_pos.x() + target_widget.width() / 2
-                
-                if pos.x() < target_center:
-                    self.drop_indicator.setGeometry(
-                        target_pos.x() - 1,
-                        target_pos.y(),
-                        2,
-                        target_widget.height()
-                    )
-                
-                accent_color = get_windows_accent_color() if is_windows_11_or_later() else "#0078d4"
-                self.drop_indicator.setStyleSheet(f"background-color: {accent_color};")
+            if self.drop_indicator is None:
+                self.drop_indicator = QWidget(self)
+                self.drop_indicator.setFixedWidth(2)
+                # A flat bar: paint it ourselves so Qt can skip background and sibling handling
+                self._drop_indicator_color = QColor(_ACCENT_COLOR)
+                self.drop_indicator.setAttribute(Qt.WA_OpaquePaintEvent, True)
+                self.drop_indicator.setAttribute(Qt.WA_NoSystemBackground, True)
+                self.drop_indicator.setAttribute(Qt.WA_StaticContents, True)
+                self.drop_indicator.paintEvent = self._paint_drop_indicator
                 self.drop_indicator.raise_()
-                self.drop_indicator.show()
-                return
+            
+            if pos.x() < center_x and indicator_rect != self._last_indicator_rect:
+                self.drop_indicator.setGeometry(indicator_rect)
+                self._last_indicator_rect = indicator_rect
+            
+            self.drop_indicator.show()
+            return
         
-        self.drop_indicator.hide()
+        self.hide_drop_indicator()
 
     def start_drag(self, event, widget):
         if event.button() == Qt.LeftButton:
-            pixmap = widget.grab()
-            
-            painter = QPainter(pixmap)
-            painter.setCompositionMode(QPainter.CompositionMode_DestinationIn)
-            painter.fillRect(pixmap.rect(), QColor(0, 0, 0, 180))
-            painter.end()
+            # Shared bounded cache; size and scale factor are part of the key, and the
+            # per-tile id keeps a rebuilt tile from picking up its predecessor's pixmap
+            tile_id = getattr(widget, "_drag_pixmap_id", None)
+            if tile_id is None:
+                tile_id = widget._drag_pixmap_id = next(self._drag_pixmap_ids)
+            key = f"drag:{tile_id}:{widget.width()}x{widget.height()}@{widget.devicePixelRatioF()}"
+            pixmap = QPixmapCache.find(key)
+            if pixmap is None:
+                # Fade in a premultiplied image: grabbed pixmaps of opaque widgets may have
+                # no alpha channel, and this is the raster engine's fastest blend format
+                image = widget.grab().toImage().convertToFormat(QImage.Format_ARGB32_Premultiplied)
+                
+                painter = QPainter(image)
+                painter.setCompositionMode(QPainter.CompositionMode_DestinationIn)
+                painter.fillRect(image.rect(), QColor(0, 0, 0, 180))
+                painter.end()
+                
+                pixmap = QPixmap.fromImage(image)
+                pixmap.setDevicePixelRatio(widget.devicePixelRatioF())
+                QPixmapCache.insert(key, pixmap)
             
             drag = QDrag(widget)
             mime_data = QMimeData()
@@ -1043,11 +1355,27 @@ class DraggableWidget(QWidget):
             drag.setPixmap(pixmap)
             drag.setHotSpot(event.position().toPoint())
             
-            drag.exec(Qt.MoveAction)
+            self._drag_source_rect = widget.geometry()
+            try:
+                drag.exec(Qt.MoveAction)
+            finally:
+                self._drag_source_rect = None
 
 
 class BackupLabelDialog(QDialog):
     """Dialog for adding or editing labels and color tags for save backups"""
+    PRESET_COLORS = [
+        ("#4CAF50", "Green"), 
+        ("#2196F3", "Blue"), 
+        ("#FFC107", "Yellow"), 
+        ("#FF5722", "Orange"), 
+        ("#E91E63", "Pink"),
+        ("#9C27B0", "Purple"),
+        ("#607D8B", "Gray"),
+        ("#FFFFFF", "White")
+    ]
+    PRESET_QSS = {color_hex: f"background-color: {color_hex}; border: 1px solid #888;" for color_hex, _ in PRESET_COLORS}
+    
     def __init__(self, parent=None, current_label="", current_color=None):
         super().__init__(parent)
         self.setWindowTitle("Save Backup Label")
@@ -1072,7 +1400,9 @@ class BackupLabelDialog(QDialog):
         
         self.color_preview = QFrame()
         self.color_preview.setFixedSize(40, 40)
-        self.color_preview.setStyleSheet(f"background-color: {self.selected_color.name()}; border: 1px solid #888;")
+        self.color_preview.setFrameShape(QFrame.Box)
+        self.color_preview.setAutoFillBackground(True)
+        self._set_preview_color(self.selected_color)
         color_layout.addWidget(self.color_preview)
         
         color_button = QPushButton("Select Color")
@@ -1080,23 +1410,13 @@ class BackupLabelDialog(QDialog):
         color_layout.addWidget(color_button)
         
         presets_layout = QHBoxLayout()
-        presets = [
-            ("#4CAF50", "Green"), 
-            ("#2196F3", "Blue"), 
-            ("#FFC107", "Yellow"), 
-            ("#FF5722", "Orange"), 
-            ("#E91E63", "Pink"),
-            ("#9C27B0", "Purple"),
-            ("#607D8B", "Gray"),
-            ("#FFFFFF", "White")
-        ]
-        
-        for color_hex, color_name in presets:
+        for color_hex, color_name in self.PRESET_COLORS:
             preset_btn = QPushButton()
             preset_btn.setFixedSize(30, 30)
-            preset_btn.setStyleSheet(f"background-color: {color_hex}; border: 1px solid #888;")
+            preset_btn.setStyleSheet(self.PRESET_QSS[color_hex])
             preset_btn.setToolTip(color_name)
-            preset_btn.clicked.connect(lambda checked=False, hex=color_hex: self.use_preset_color(hex))
+            preset_btn.setProperty("color_hex", color_hex)
+            preset_btn.clicked.connect(self._on_preset_clicked)
             presets_layout.addWidget(preset_btn)
         
         layout.addLayout(color_layout)
@@ -1118,11 +1438,20 @@ class BackupLabelDialog(QDialog):
         color = QColorDialog.getColor(self.selected_color, self, "Choose Color Tag")
         if color.isValid():
             self.selected_color = color
-            self.color_preview.setStyleSheet(f"background-color: {color.name()}; border: 1px solid #888;")
+            self._set_preview_color(color)
+    
+    @Slot()
+    def _on_preset_clicked(self):
+        self.use_preset_color(self.sender().property("color_hex"))
     
     def use_preset_color(self, color_hex):
         self.selected_color = QColor(color_hex)
-        self.color_preview.setStyleSheet(f"background-color: {color_hex}; border: 1px solid #888;")
+        self._set_preview_color(self.selected_color)
+    
+    def _set_preview_color(self, color):
+        palette = self.color_preview.palette()
+        palette.setColor(QPalette.Window, color)
+        self.color_preview.setPalette(palette)
     
     def get_values(self):
         return self.label_input.text(), self.selected_color.name()
@@ -1139,6 +1468,7 @@ class GameNameSuggestionDialog(QDialog):
         self.selected_name = ""
         self.loading = False
         self.progress_dialog = None # Add this line
+        self._last_suggestions = None
         
         self.init_ui()
     
@@ -1155,6 +1485,17 @@ class GameNameSuggestionDialog(QDialog):
         form.addRow("Game Title:", self.name_input)
         layout.addLayout(form)
         
+        if self.suggestions:
+            # Plain one-line names; a string model avoids an item object per suggestion
+            self.suggestions_model = QStringListModel(self)
+            self.suggestions_list = QListView()
+            self.suggestions_list.setModel(self.suggestions_model)
+            self.suggestions_list.setUniformItemSizes(True)
+            self.suggestions_list.setEditTriggers(QAbstractItemView.NoEditTriggers)
+            self.suggestions_list.clicked.connect(self.on_suggestion_clicked)
+            self.suggestions_list.doubleClicked.connect(self.on_suggestion_double_clicked)
+            layout.addWidget(self.suggestions_list)
+        
         buttons_layout = QHBoxLayout()
         
         self.ok_button = QPushButton("OK")
@@ -1172,21 +1513,26 @@ class GameNameSuggestionDialog(QDialog):
     
     def populate_suggestions(self, suggestions):
         """Populate the suggestions list"""
-        self.suggestions_list.clear()
+        suggestions_key = tuple(suggestions or ())
+        if suggestions_key == self._last_suggestions:
+            return
+        self._last_suggestions = suggestions_key
+        
         if suggestions:
-            self.suggestions_list.addItems(suggestions)
-            self.suggestions_list.setCurrentRow(0) if suggestions else None
+            self.suggestions_model.setStringList(list(suggestions))
+            self.suggestions_list.setEnabled(True)
+            self.suggestions_list.setCurrentIndex(self.suggestions_model.index(0))
         else:
-            self.suggestions_list.addItem("No suggestions available")
+            self.suggestions_model.setStringList(["No suggestions available"])
             self.suggestions_list.setEnabled(False)
     
-    def on_suggestion_clicked(self, item):
+    def on_suggestion_clicked(self, index):
         """Handle suggestion click"""
-        self.name_input.setText(item.text())
+        self.name_input.setText(index.data())
     
-    def on_suggestion_double_clicked(self, item):
+    def on_suggestion_double_clicked(self, index):
         """Handle suggestion double-click by accepting the dialog"""
-        self.name_input.setText(item.text())
+        self.name_input.setText(index.data())
         self.accept_name()
     
     def accept_name(self):
@@ -1215,9 +1561,9 @@ class GameNameSuggestionDialog(QDialog):
                 self.progress_dialog = None
         # self.ok_button.setEnabled(not is_loading) # Remove this line
         
-        if is_loading:
-            self.suggestions_list.clear()
-            QApplication.processEvents() 
+        if is_loading and hasattr(self, 'suggestions_list'):
+            self.suggestions_model.setStringList([])
+            self._last_suggestions = None
     
     def closeEvent(self, event):
         """Handle window close events"""
@@ -1229,55 +1575,49 @@ class GameNameSuggestionDialog(QDialog):
         else:
             event.accept()
 
-class HTMLDelegate(QStyledItemDelegate):
-    def __init__(self, parent=None): # Added parent argument
-        super().__init__(parent) # Call super with parent
-
-    def paint(self, painter, option, index):
-        painter.save()
-        text = index.data()
-        doc = QTextDocument()
-        doc.setHtml(text)
-        doc.setTextWidth(option.rect.width())
-        painter.translate(option.rect.topLeft())
-        doc.drawContents(painter)
-        painter.restore()
-
-    def sizeHint(self, option, index):
-        doc = QTextDocument()
-        doc.setHtml(index.data())
-        doc.setTextWidth(option.rect.width())
-        return doc.size().toSize()
-
 class BackupItemDelegate(QStyledItemDelegate):
     """Custom delegate for backup items to show color bar on left side"""
+    COLOR_BAR_WIDTH = 2
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._brush_cache = {}
+    
     def paint(self, painter, option, index):
+        super().paint(painter, option, index)
+        
         backup = index.data(Qt.UserRole)
         if not backup:
-            return super().paint(painter, option, index)
+            return
         
         color_hex = backup.get("color", "#FFFFFF")
+        if not color_hex or color_hex == "#FFFFFF":
+            return
         
-        super().paint(painter, option, index)
+        # Filling with a QColor builds a temporary brush each call, so keep the brushes
+        brush = self._brush_cache.get(color_hex)
+        if brush is None:
+            brush = QBrush(QColor(color_hex))
+            self._brush_cache[color_hex] = brush
         
-        if color_hex and color_hex != "#FFFFFF":
-            painter.save()
-            
-            color_bar_width = 2
-            color_rect = QRect(option.rect)
-            color_rect.setWidth(color_bar_width)
-            painter.fillRect(color_rect, QColor(color_hex))
-            
-            painter.restore()
+        # fillRect leaves the painter state untouched, so no save/restore needed
+        rect = option.rect
+        painter.fillRect(rect.x(), rect.y(), self.COLOR_BAR_WIDTH, rect.height(), brush)
 
 
 class Toast(QFrame):
     closed = Signal() # Ensure QObject is imported for Signal
     ICON_SIZE = QSize(18, 18) # Define standard icon size
+    _stylesheets = {} # is_dark -> stylesheet, shared by every toast
 
     def __init__(self, parent, message, icon_type="info", duration=3000):
         super().__init__(parent)
         
+        self.message = message
+        self.icon_type = icon_type
+        self.duration = duration
+        self.closing = False
+        
         self.setObjectName("ToastClassWindow")
         self.setWindowFlags(
             Qt.WindowType.FramelessWindowHint | 
@@ -1290,67 +1630,21 @@ class Toast(QFrame):
 
         self.setFixedWidth(300)
 
-        self.accent_color = get_windows_accent_color() if is_windows_11_or_later() else "#0078D4"
+        self.accent_color = _ACCENT_COLOR
         
         palette = self.parent().palette() if self.parent() else QApplication.palette()
         is_dark_theme = palette.color(QPalette.ColorRole.Window).value() < 128
 
-        if is_dark_theme:
-            self.bg_color = QColor("#2D2D2D")
-            self.text_color = QColor("#F0F0F0")
-            self.border_color = QColor("#4A4A4A")
-            self.close_button_color = QColor("#A0A0A0")
-            self.close_button_hover_color = QColor("#FFFFFF")
-        else:
-            self.bg_color = QColor("#F0F0F0")
-            self.text_color = QColor("#2D2D2D")
-            self.border_color = QColor("#C0C0C0")
-            self.close_button_color = QColor("#505050")
-            self.close_button_hover_color = QColor("#000000")
-
-        # Icon qcolor is primarily for custom-drawn icons like success
-        success_icon_color = QColor("#48C774")
-
-        self.bg_color_str = self.bg_color.name()
-        self.text_color_str = self.text_color.name()
-        self.border_color_str = self.border_color.name()
-        self.close_button_color_str = self.close_button_color.name()
-        self.close_button_hover_color_str = self.close_button_hover_color.name()
+        stylesheet = Toast._stylesheets.get(is_dark_theme)
+        if stylesheet is None:
+            stylesheet = _TOAST_QSS
+            for placeholder, color in _TOAST_COLORS[is_dark_theme].items():
+                stylesheet = stylesheet.replace(placeholder, color)
+            Toast._stylesheets[is_dark_theme] = stylesheet
 
         self.content_frame = QFrame(self)
         self.content_frame.setObjectName("toastContentFrame")
-        self.content_frame.setStyleSheet(f"""
-            #toastContentFrame {{
-                background-color: {self.bg_color_str};
-                border-radius: 6px;
-                border: 1px solid {self.border_color_str};
-            }}
-            QLabel {{
-                color: {self.text_color_str};
-                background-color: transparent;
-                font-size: 9pt;
-            }}
-            #messageLabel {{
-                padding-right: 3px; 
-            }}
-            #closeButton {{
-                background-color: transparent;
-                color: {self.close_button_color_str};
-                border: none;
-                font-size: 12pt;
-                font-weight: bold;
-                padding: 0px; 
-            }}
-            #closeButton:hover {{
-                color: {self.close_button_hover_color_str};
-            }}
-            #iconLabel {{
-                /* Styling for pixmap container, not text icon */
-                /* Removed color, font-size, font-weight */
-                /* Padding and min-width are handled by setFixedSize and layout spacing */
-                /* text-align: center; (setAlignment is used for pixmap) */
-            }}
-        """)
+        self.content_frame.setStyleSheet(stylesheet)
 
         outer_layout = QVBoxLayout(self)
         outer_layout.setContentsMargins(0,0,0,0)
@@ -1362,39 +1656,11 @@ class Toast(QFrame):
         content_layout.setSpacing(6)
         content_layout.setAlignment(Qt.AlignVCenter)  # Ensure vertical centering
 
-        icon_pixmap = QPixmap()
-        style = QApplication.style()
-
-        if icon_type == "success":
-            pixmap = QPixmap(self.ICON_SIZE)
-            pixmap.fill(Qt.transparent)
-            painter = QPainter(pixmap)
-            pen = QPen(success_icon_color)
-            pen.setWidth(2) # Adjusted for ICON_SIZE
-            pen.setCapStyle(Qt.RoundCap)
-            pen.setJoinStyle(Qt.RoundJoin)
-            painter.setPen(pen)
-            painter.setRenderHint(QPainter.Antialiasing)
-            
-            w, h = self.ICON_SIZE.width(), self.ICON_SIZE.height()
-            path = QPainterPath()
-            path.moveTo(QPointF(w * 0.20, h * 0.50))
-            path.lineTo(QPointF(w * 0.45, h * 0.75))
-            path.lineTo(QPointF(w * 0.80, h * 0.25))
-            painter.drawPath(path)
-            painter.end()
-            icon_pixmap = pixmap
-        elif icon_type == "warning":
-            icon_pixmap = style.standardPixmap(QStyle.StandardPixmap.SP_MessageBoxWarning)
-        elif icon_type == "error":
-            icon_pixmap = style.standardPixmap(QStyle.StandardPixmap.SP_MessageBoxCritical)
-        else:  # "info" or default
-            icon_pixmap = style.standardPixmap(QStyle.StandardPixmap.SP_MessageBoxInformation)
-        
         icon_label = QLabel()
         icon_label.setObjectName("iconLabel")
+        icon_pixmap = _toast_icon_pixmap(icon_type, self.devicePixelRatioF())
         if not icon_pixmap.isNull():
-            icon_label.setPixmap(icon_pixmap.scaled(self.ICON_SIZE, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+            icon_label.setPixmap(icon_pixmap)
         icon_label.setFixedSize(self.ICON_SIZE)
         icon_label.setAlignment(Qt.AlignCenter | Qt.AlignVCenter)  # Center pixmap vertically and horizontally
 
@@ -1413,10 +1679,11 @@ class Toast(QFrame):
         self.opacity_animation.setStartValue(0.0)
         self.opacity_animation.setEndValue(1.0) # Fade to full opacity
         self.opacity_animation.setEasingCurve(QEasingCurve.InOutCubic) # Smoother easing
-        self.opacity_animation.start()
+        # Started from showEvent
         
         self.timer = QTimer(self)
         self.timer.setSingleShot(True)
+        self.timer.setTimerType(Qt.CoarseTimer) # Dismissal a few ms late is fine; lets the OS batch wakeups
         self.timer.timeout.connect(self.start_closing)
         if duration > 0:
             self.timer.start(duration)
@@ -1425,6 +1692,7 @@ class Toast(QFrame):
         self.start_closing()
     
     def start_closing(self):
+        self.closing = True
         self.opacity_animation.setDirection(QPropertyAnimation.Backward)
         self.opacity_animation.finished.connect(self.on_close_animation_finished)
         self.opacity_animation.start()
@@ -1443,6 +1711,47 @@ class Toast(QFrame):
         self.opacity_animation.start()
 
 
+@functools.lru_cache(maxsize=None)
+def _toast_icon_pixmap(icon_type, dpr):
+    """Toast icon at Toast.ICON_SIZE; the same for every toast of a type and scale, so drawn once"""
+    size = Toast.ICON_SIZE
+    if icon_type == "success":
+        pixmap = QPixmap(size * dpr)
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
+        pen = QPen(QColor("#48C774"))
+        pen.setWidth(2) # Adjusted for ICON_SIZE
+        pen.setCapStyle(Qt.RoundCap)
+        pen.setJoinStyle(Qt.RoundJoin)
+        painter.setPen(pen)
+        painter.setRenderHint(QPainter.Antialiasing)
+        
+        w, h = size.width(), size.height()
+        path = QPainterPath()
+        path.moveTo(QPointF(w * 0.20, h * 0.50))
+        path.lineTo(QPointF(w * 0.45, h * 0.75))
+        path.lineTo(QPointF(w * 0.80, h * 0.25))
+        painter.drawPath(path)
+        painter.end()
+        return pixmap
+    
+    style = QApplication.style()
+    if icon_type == "warning":
+        pixmap = style.standardPixmap(QStyle.StandardPixmap.SP_MessageBoxWarning)
+    elif icon_type == "error":
+        pixmap = style.standardPixmap(QStyle.StandardPixmap.SP_MessageBoxCritical)
+    else:  # "info" or default
+        pixmap = style.standardPixmap(QStyle.StandardPixmap.SP_MessageBoxInformation)
+    if pixmap.isNull():
+        return pixmap
+    target_size = size * dpr
+    if pixmap.size() != target_size: # Styles often already provide this size
+        pixmap = pixmap.scaled(target_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+    pixmap.setDevicePixelRatio(dpr)
+    return pixmap
+
+
 class ToastManager(QObject):
     def __init__(self, parent):
         super().__init__(parent)
@@ -1450,13 +1759,51 @@ class ToastManager(QObject):
         self.toasts = []
         self.spacing = 8 # Reduced spacing
         self.padding_from_edge = 15 # Distance from parent window edges
+        
+        # Bursts of removals and geometry changes in one event loop turn share one repositioning pass
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(0)
+        self._update_timer.timeout.connect(self._do_update_positions)
+        self._last_layout_key = None
+        
+        # Window and screen geometry only change on these events, so they are read once
+        # per change instead of on every pass
+        self._parent_rect = None
+        self._screen_geometry = None
+        if self.main_window:
+            self.main_window.installEventFilter(self)
+    
+    _GEOMETRY_EVENTS = (
+        QEvent.Move, QEvent.Resize, QEvent.WindowStateChange,
+        QEvent.ScreenChangeInternal, QEvent.Show, QEvent.Hide
+    )
+    
+    def eventFilter(self, watched, event):
+        if watched is self.main_window and event.type() in self._GEOMETRY_EVENTS:
+            self._parent_rect = None
+            self._screen_geometry = None
+            if self.toasts:
+                self._update_positions()
+        return super().eventFilter(watched, event)
     
     def show_toast(self, message, icon_type="info", duration=3000):
+        # Repeats of a toast that is still up extend it instead of stacking copies
+        for toast in self.toasts:
+            if toast.message == message and toast.icon_type == icon_type and not toast.closing:
+                if duration > 0 and toast.duration > 0:
+                    toast.timer.start(min(toast.timer.remainingTime() + duration, 2 * duration))
+                return toast
+        
         # Pass self.parent (main window) as the parent to Toast
         toast = Toast(self.main_window, message, icon_type, duration)
         toast.closed.connect(lambda t=toast: self.remove_toast(t)) # Pass toast instance
         self.toasts.append(toast)
-        self._update_positions()
+        # Place a new toast before it is shown so it never flashes at its default spot;
+        # only removals and window geometry changes go through the coalescing timer
+        self._last_layout_key = None
+        self._update_timer.stop()
+        self._do_update_positions()
         toast.show()
         return toast
     
@@ -1467,20 +1814,36 @@ class ToastManager(QObject):
             self._update_positions()
     
     def _update_positions(self):
+        if not self._update_timer.isActive():
+            self._update_timer.start()
+    
+    def _do_update_positions(self):
         if not self.main_window or not self.toasts:
             return
 
-        parent_rect = self.main_window.frameGeometry()
-        
-        # Get the screen the main window is on
-        window_handle = self.main_window.windowHandle()
-        screen = window_handle.screen() if window_handle and self.main_window.isVisible() else QApplication.primaryScreen()
-        # Fallback to primaryScreen if windowHandle is not valid (e.g. window not shown yet)
-        # or if main_window is not visible, its screen might be None.
-        if screen is None:
-            screen = QApplication.primaryScreen()
-            
-        screen_geometry = screen.availableGeometry()
+        if self._parent_rect is None:
+            self._parent_rect = self.main_window.frameGeometry()
+        parent_rect = self._parent_rect
+        
+        if self._screen_geometry is None:
+            # Get the screen the main window is on
+            window_handle = self.main_window.windowHandle()
+            screen = window_handle.screen() if window_handle and self.main_window.isVisible() else QApplication.primaryScreen()
+            # Fallback to primaryScreen if windowHandle is not valid (e.g. window not shown yet)
+            # or if main_window is not visible, its screen might be None.
+            if screen is None:
+                screen = QApplication.primaryScreen()
+            self._screen_geometry = screen.availableGeometry()
+        screen_geometry = self._screen_geometry
+        
+        # Nothing to move if neither the window, the screen nor the stack changed
+        layout_key = (
+            parent_rect.getRect(), screen_geometry.getRect(),
+            tuple((id(toast), toast.width(), toast.height()) for toast in self.toasts)
+        )
+        if layout_key == self._last_layout_key:
+            return
+        self._last_layout_key = layout_key
         
         # Start position for the top of the *lowest* (newest) toast
         current_toast_top_y = parent_rect.bottom() - self.spacing
@@ -1507,6 +1870,8 @@ class ToastManager(QObject):
 
 
 class ProgressDialog(LoadingDialog):
+    _stylesheets = {} # is_dark -> (progress bar, cancel button) stylesheets
+    
     def __init__(self, parent=None, message="Operation in progress...", cancellable=False, indeterminate=False): # Added indeterminate
         super().__init__(parent, message)
         self.setFixedSize(500, 180)
@@ -1533,70 +1898,37 @@ class ProgressDialog(LoadingDialog):
         window_bg_color = palette.color(QPalette.ColorRole.Window)
         is_dark_theme = (window_bg_color.red() + window_bg_color.green() + window_bg_color.blue()) / 3 < 128
 
-
-        if is_dark_theme:
-            progress_bar_bg_color = "#222222" # Dark background
-            progress_bar_chunk_color = get_windows_accent_color() if is_windows_11_or_later() else "#0078D4" # Accent color for chunk
-            progress_bar_border_color = "#555555" # Dark border
-            progress_bar_text_color = "#E0E0E0" # Light text
-            cancel_button_bg_color = "#333333"
-            cancel_button_text_color = "white"
-            cancel_button_border_color = "#555555"
-            cancel_button_hover_bg_color = "#444444"
-            cancel_button_pressed_bg_color = "#222222"
-        else: # Light Mode
-            progress_bar_bg_color = "#F0F0F0"  # Light gray background
-            progress_bar_chunk_color = get_windows_accent_color() if is_windows_11_or_later() else "#0053A0" # Darker blue for light mode chunk
-            progress_bar_border_color = "#B0B0B0" # Medium gray border
-            progress_bar_text_color = "#202020" # Dark text
-            cancel_button_bg_color = "#E0E0E0"
-            cancel_button_text_color = "black"
-            cancel_button_border_color = "#B0B0B0"
-            cancel_button_hover_bg_color = "#D0D0D0"
-            cancel_button_pressed_bg_color = "#C0C0C0"
-
-        self.progress_bar.setStyleSheet(f"""
-            QProgressBar {{
-                border: 1px solid {progress_bar_border_color};
-                border-radius: 3px;
-                text-align: center;
-                background-color: {progress_bar_bg_color};
-                color: {progress_bar_text_color}; /* Added text color */
-                min-height: 20px;
-            }}
-            
-            QProgressBar::chunk {{
-                background-color: {progress_bar_chunk_color};
-                border-radius: 3px;
-            }}
-        """)
+        progress_bar_qss, cancel_button_qss = self._get_stylesheets(is_dark_theme)
+        self.progress_bar.setStyleSheet(progress_bar_qss)
         layout.addWidget(self.progress_bar)
         
         if cancellable:
             button_layout = QHBoxLayout()
             cancel_button = QPushButton("Cancel")
             cancel_button.clicked.connect(self.reject)
-            cancel_button.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: {cancel_button_bg_color};
-                    color: {cancel_button_text_color};
-                    border: 1px solid {cancel_button_border_color};
-                    border-radius: 3px;
-                    padding: 5px;
-                    min-width: 80px;
-                }}
-                QPushButton:hover {{
-                    background-color: {cancel_button_hover_bg_color};
-                }}
-                QPushButton:pressed {{
-                    background-color: {cancel_button_pressed_bg_color};
-                }}
-            """)
+            cancel_button.setStyleSheet(cancel_button_qss)
             button_layout.addStretch()
             button_layout.addWidget(cancel_button)
             button_layout.addStretch()
             layout.addLayout(button_layout)
     
+    @classmethod
+    def _get_stylesheets(cls, is_dark_theme):
+        stylesheets = cls._stylesheets.get(is_dark_theme)
+        if stylesheets is None:
+            colors = dict(_PROGRESS_COLORS[is_dark_theme])
+            if is_dark_theme or is_windows_11_or_later():
+                colors["%CHUNK_COLOR%"] = _ACCENT_COLOR
+            else:
+                colors["%CHUNK_COLOR%"] = "#0053A0" # Darker blue for light mode chunk
+            progress_bar_qss = _PROGRESS_BAR_QSS
+            cancel_button_qss = _CANCEL_BUTTON_QSS
+            for placeholder, color in colors.items():
+                progress_bar_qss = progress_bar_qss.replace(placeholder, color)
+                cancel_button_qss = cancel_button_qss.replace(placeholder, color)
+            stylesheets = cls._stylesheets[is_dark_theme] = (progress_bar_qss, cancel_button_qss)
+        return stylesheets
+    
     def set_progress(self, value):
         self.progress_bar.setValue(value)
     
@@ -1,21 +1,30 @@
 import os
 import json
+import http.cookiejar
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import re
+import glob
+import fnmatch
+import functools
+import stat
 import subprocess
 import sys
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import ctypes
 from ctypes import wintypes
 import platform
 import winreg
 
 
+_UNSAFE_FILENAME_CHARS = str.maketrans({c: "_" for c in ' :/\\*?"<>|.'})
+_DISALLOWED_FILENAME_RE = re.compile(r"[^\w-]")  # \w is str.isalnum() plus "_"
+
 def make_safe_filename(name):
-    safe_name = name.lower().replace(" ", "_")
-    for char in [':', '/', '\\', '*', '?', '"', '<', '>', '|', '.']:
-        safe_name = safe_name.replace(char, "_")
-    safe_name = ''.join(c for c in safe_name if c.isalnum() or c in ['_', '-'])
-    return safe_name
+    return _DISALLOWED_FILENAME_RE.sub("", name.lower().translate(_UNSAFE_FILENAME_CHARS))
 
 def load_config(config_file):
     if os.path.exists(config_file):
@@ -28,8 +37,15 @@ def load_config(config_file):
     return {"backup_dir": "", "games": {}}
 
 def save_config(config_file, config):
-    with open(config_file, 'w') as f:
-        json.dump(config, f, indent=4)
+    # Write a sibling file and swap it in, so a crash mid-write can't truncate the config
+    data = json.dumps(config, indent=4)  # One write instead of one per encoder chunk
+    tmp_file = config_file + ".tmp"
+    with open(tmp_file, 'w') as f:
+        f.write(data)
+    os.replace(tmp_file, config_file)
+
+_GENERIC_SAVE_FOLDER_NAMES = frozenset(['saves', 'saved games', 'savedata', 'save games', 'savegames', 'save files'])
+_SAVE_FILE_SUFFIXES = ('.sav', '.dat', '.bin', '.json', '.xml')
 
 def generate_game_name_suggestions(paths):
     suggestions = set()
@@ -40,10 +56,11 @@ def generate_game_name_suggestions(paths):
             suggestions.add(folder_name.replace('_', ' ').title())
             
             try:
-                for subfolder in os.listdir(path):
-                    subfolder_path = os.path.join(path, subfolder)
-                    if os.path.isdir(subfolder_path):
-                        suggestions.add(subfolder.replace('_', ' ').title())
+                # DirEntry.is_dir() uses the type from the listing instead of a stat per entry
+                with os.scandir(path) as entries:
+                    for entry in entries:
+                        if entry.is_dir():
+                            suggestions.add(entry.name.replace('_', ' ').title())
             except (PermissionError, FileNotFoundError):
                 pass
         else:
@@ -55,13 +72,9 @@ def generate_game_name_suggestions(paths):
             if file_name and len(file_name) > 3:  # Avoid very short names
                 suggestions.add(file_name.replace('_', ' ').title())
     
-    cleaned_suggestions = []
-    for suggestion in suggestions:
-        if suggestion.lower() not in ['saves', 'saved games', 'savedata', 'save games', 'savegames', 'save files']:
-            if not suggestion.lower().endswith(('.sav', '.dat', '.bin', '.json', '.xml')):
-                cleaned_suggestions.append(suggestion)
-    
-    return cleaned_suggestions
+    return [suggestion for suggestion in suggestions
+            if suggestion.lower() not in _GENERIC_SAVE_FOLDER_NAMES
+            and not suggestion.lower().endswith(_SAVE_FILE_SUFFIXES)]
 
 def open_directory(path):    
     try:
@@ -78,6 +91,50 @@ def open_directory(path):
         print(f"Failed to open directory: {e}")
         return False
 
+@functools.lru_cache(maxsize=None)
+def _wiki_path_variables():
+    """
+    (pattern, values) for the variables PCGamingWiki paths use, resolved once per session.
+    The pattern matches every token in one pass; %USERPROFILE%\\Documents is listed first
+    so it wins over %USERPROFILE% and maps to the real Documents folder
+    """
+    # use wintypes to find actual documents folder
+    CSIDL_PERSONAL = 5
+    SHGFP_TYPE_CURRENT = 0 
+    
+    buf = ctypes.create_unicode_buffer(wintypes.MAX_PATH)
+    ctypes.windll.shell32.SHGetFolderPathW(None, CSIDL_PERSONAL, None, SHGFP_TYPE_CURRENT, buf)
+    variables = [('%USERPROFILE%\\Documents', buf.value)]
+    for name in ("USERPROFILE", "APPDATA", "LOCALAPPDATA", "PUBLIC", "PROGRAMDATA"):
+        value = os.environ.get(name)
+        if value is not None:
+            variables.append((f"%{name}%", value))
+    pattern = re.compile("|".join(re.escape(token) for token, _ in variables))
+    return pattern, dict(variables)
+
+# pattern to match rows in the save location table; the captures can't run past their
+# own </th> or </td>, so a row without a location cell fails fast instead of rescanning the page
+_WIKI_ROW_RE = re.compile(r'<th\s+scope="row"\s+class="table-gamedata-body-system">((?:[^<]|<(?!/th>))*?)</th>\s*?<td\s+class="table-gamedata-body-location"><span[^>]*>((?:[^<]|<(?!/td>))*?)</span></td>')
+_WIKI_BR_RE = re.compile(r'<br\s*/?>')
+_WIKI_TAG_RE = re.compile(r'<[^>]*>')
+_BACKSLASHES_RE = re.compile(r'\\+')
+
+# Shared keep-alive session for every HTTP call in the app, so repeat requests to the
+# same host (wiki API calls, IGDB thumbnails) reuse one TLS connection. Worker threads use
+# it concurrently: every call is a one-off GET/POST with its own headers and parameters,
+# nothing changes the session after this setup and the cookie policy rejects all cookies,
+# so the only shared state is urllib3's thread-safe connection pool.
+# Failed connects and 5xx GETs are retried twice with a short backoff and no Retry-After
+# waits, since an IGDB search keeps a dialog waiting
+http_session = requests.Session()
+http_session.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+http_session.mount("https://", HTTPAdapter(
+    pool_connections=8, pool_maxsize=16,
+    max_retries=Retry(total=2, backoff_factor=0.25, status_forcelist=[500, 502, 503, 504],
+                      respect_retry_after_header=False)
+))
+WIKI_REQUEST_TIMEOUT = 10  # seconds
+
 def fetch_pcgamingwiki_save_locations(game_name):
     """
     Fetch save game locations from PCGamingWiki API using sections
@@ -89,7 +146,7 @@ def fetch_pcgamingwiki_save_locations(game_name):
         # Step 1: Use opensearch to get the exact wiki page title
         search_url = f"https://www.pcgamingwiki.com/w/api.php?action=opensearch&format=json&search={game_name.replace(' ', '%20')}&formatversion=2"
         
-        response = requests.get(search_url)
+        response = http_session.get(search_url, timeout=WIKI_REQUEST_TIMEOUT)
         response.raise_for_status()
         search_data = response.json()
         
@@ -103,7 +160,7 @@ def fetch_pcgamingwiki_save_locations(game_name):
         # Step 2: Get the sections to find the save location section index
         sections_url = f"https://www.pcgamingwiki.com/w/api.php?action=parse&format=json&page={wiki_page_name}&prop=sections&formatversion=2"
         
-        response = requests.get(sections_url)
+        response = http_session.get(sections_url, timeout=WIKI_REQUEST_TIMEOUT)
         response.raise_for_status()
         sections_data = response.json()
         
@@ -127,7 +184,7 @@ def fetch_pcgamingwiki_save_locations(game_name):
         # Step 3: Get the content of the save location section
         content_url = f"https://www.pcgamingwiki.com/w/api.php?action=parse&format=json&page={wiki_page_name}&section={save_section_index}&formatversion=2"
         
-        response = requests.get(content_url)
+        response = http_session.get(content_url, timeout=WIKI_REQUEST_TIMEOUT)
         response.raise_for_status()
         content_data = response.json()
         
@@ -140,9 +197,7 @@ def fetch_pcgamingwiki_save_locations(game_name):
         # extract paths from the HTML content
         html_content = content_data['parse']['text']
         
-        # pattern to match rows in the table
-        row_pattern = r'<th\s+scope="row"\s+class="table-gamedata-body-system">(.*?)</th>\s*?<td\s+class="table-gamedata-body-location"><span[^>]*>(.*?)</span></td>'
-        store_rows = re.findall(row_pattern, html_content, re.DOTALL)
+        store_rows = _WIKI_ROW_RE.findall(html_content)
         
         split_rows = []
 
@@ -151,61 +206,33 @@ def fetch_pcgamingwiki_save_locations(game_name):
             path_html = row[1]
 
             # split the path_html by <br> tags
-            path_html_parts = re.split(r'<br\s*/?>', path_html)
+            path_html_parts = _WIKI_BR_RE.split(path_html)
             if len(path_html_parts) > 1:
                 for index, part in enumerate(path_html_parts):
                     # clean up the path - remove HTML tags
-                    path = re.sub(r'<[^>]*>', '', part)
+                    path = _WIKI_TAG_RE.sub('', part)
                     path = path.strip()
                     split_rows.append((f"{store_type} [{str(index + 1)}]", path))
             else:
                 # clean up the path - remove HTML tags
-                path = re.sub(r'<[^>]*>', '', path_html)
+                path = _WIKI_TAG_RE.sub('', path_html)
                 path = path.strip()
                 split_rows.append((store_type, path))
 
-        print(split_rows)
-
         for row in split_rows:
             store_type = row[0].strip()
             path = row[1]
             
             # normalize backslashes for Windows paths
-            path = re.sub(r'\\+', '\\\\', path)
+            path = _BACKSLASHES_RE.sub(r'\\', path)
             
             # replace common environment variables
             try:
-                if '%USERPROFILE%' in path:
-                    if '%USERPROFILE%\\Documents' in path:
-                        # use wintypes to find actual documents folder
-                        CSIDL_PERSONAL = 5
-                        SHGFP_TYPE_CURRENT = 0 
-                        
-                        buf = ctypes.create_unicode_buffer(wintypes.MAX_PATH)
-                        ctypes.windll.shell32.SHGetFolderPathW(None, CSIDL_PERSONAL, None, SHGFP_TYPE_CURRENT, buf)
-                        documents = buf.value
-                        
-                        path = path.replace('%USERPROFILE%\\Documents', documents)
-                    else:
-                        user_profile = os.path.expandvars('%USERPROFILE%')
-                        path = path.replace('%USERPROFILE%', user_profile)
-                if '%APPDATA%' in path:
-                    appdata = os.path.expandvars('%APPDATA%')
-                    path = path.replace('%APPDATA%', appdata)
-                if '%LOCALAPPDATA%' in path:
-                    localappdata = os.path.expandvars('%LOCALAPPDATA%')
-                    path = path.replace('%LOCALAPPDATA%', localappdata)
-                if '%PUBLIC%' in path:
-                    public = os.path.expandvars('%PUBLIC%')
-                    path = path.replace('%PUBLIC%', public)
-                if '%PROGRAMDATA%' in path:
-                    programdata = os.path.expandvars('%PROGRAMDATA%')
-                    path = path.replace('%PROGRAMDATA%', programdata)
+                variables_re, values = _wiki_path_variables()
+                path = variables_re.sub(lambda match: values[match.group(0)], path)
             except Exception as e:
                 print(f"Error expanding environment variables: {e}")
             save_locations[store_type] = path
-            print(f"Store Type: {store_type}, Path: {path}")
-            print(save_locations)
         
         return save_locations
         
@@ -216,29 +243,239 @@ def fetch_pcgamingwiki_save_locations(game_name):
         print(f"Unexpected error fetching PCGamingWiki data: {e}")
         return {}
 
+PCGW_CACHE_FILE = os.path.join(os.path.expanduser("~"), ".cache", "ambidex", "pcgw_saves.json")
+PCGW_CACHE_MAX_AGE = 30 * 24 * 60 * 60  # seconds
+_pcgw_cache = None
+_pcgw_cache_lock = threading.Lock()
+
+def _load_pcgw_cache():
+    global _pcgw_cache
+    if _pcgw_cache is None:
+        try:
+            with open(PCGW_CACHE_FILE, 'r') as f:
+                _pcgw_cache = json.load(f)
+        except (OSError, ValueError):
+            _pcgw_cache = {}
+    return _pcgw_cache
+
+def cached_fetch_pcgamingwiki_save_locations(game_name):
+    """
+    Same as fetch_pcgamingwiki_save_locations, but remembers non-empty results on disk
+    for PCGW_CACHE_MAX_AGE so repeat lookups skip the network
+    """
+    key = game_name.strip().lower()
+    with _pcgw_cache_lock:
+        entry = _load_pcgw_cache().get(key)
+    if entry and time.time() - entry.get("ts", 0) < PCGW_CACHE_MAX_AGE:
+        return dict(entry["paths"])
+    
+    save_locations = fetch_pcgamingwiki_save_locations(game_name)
+    if not save_locations: # Failed or empty lookups are retried next time
+        return save_locations
+    
+    with _pcgw_cache_lock:
+        cache = _load_pcgw_cache()
+        now = time.time()
+        # Drop expired entries while rewriting, so the file only holds lookups still in use
+        for stale_key in [k for k, v in cache.items() if now - v.get("ts", 0) >= PCGW_CACHE_MAX_AGE]:
+            del cache[stale_key]
+        cache[key] = {"ts": now, "paths": save_locations}
+        try:
+            os.makedirs(os.path.dirname(PCGW_CACHE_FILE), exist_ok=True)
+            tmp_file = PCGW_CACHE_FILE + ".tmp"
+            with open(tmp_file, 'w') as f:
+                json.dump(cache, f)
+            os.replace(tmp_file, PCGW_CACHE_FILE)
+        except OSError as e:
+            print(f"Error writing PCGamingWiki cache: {e}")
+    return dict(save_locations) # Callers may modify the result; the cached dict must stay intact
+
+PATH_PROBE_TTL = 2.0  # seconds
+_path_probe_cache = {}  # path -> (probe time, exists, is_dir)
+
+def _probe_path(path):
+    """Return (exists, is_dir) from a single stat; is_dir is None when the path is missing"""
+    try:
+        return True, stat.S_ISDIR(os.stat(path).st_mode)
+    except (OSError, ValueError):
+        return False, None
+
+def probe_path(path, ttl=PATH_PROBE_TTL):
+    """
+    _probe_path with results reused for ttl seconds, so reopening the save dialog or
+    confirming a suggestion right after it was listed doesn't stat the same paths again
+    """
+    now = time.monotonic()
+    cached = _path_probe_cache.get(path)
+    if cached and now - cached[0] < ttl:
+        return cached[1], cached[2]
+    exists, is_dir = _probe_path(path)
+    _path_probe_cache[path] = (now, exists, is_dir)
+    return exists, is_dir
+
+def forget_path_probe(path):
+    """Drop a cached probe after creating or removing the path"""
+    _path_probe_cache.pop(path, None)
+
+def _probe_dir(path, probes):
+    """Existence check memoized in probes for the duration of one resolve pass"""
+    if path not in probes:
+        probes[path] = probe_path(path)[0]
+    return probes[path]
+
+_GLOB_CHARS_RE = re.compile(r"[*?[]")
+_WIKI_TOKEN_RE = re.compile(r"&lt;[^>]+&gt;")  # PCGamingWiki placeholders such as &lt;user-id&gt;
+
+def _match_save_path_pattern(pattern):
+    """
+    Expand a save path pattern into (path, is_dir) pairs. A pattern with a single wildcard
+    component (base/* or base/*/sub) is matched with one os.scandir of its base, reusing the
+    entries' type info instead of a stat per match; anything else falls back to glob
+    """
+    # Like glob, a trailing separator only matches directories; normpath drops it below
+    dirs_only = pattern.endswith(os.sep) or bool(os.altsep and pattern.endswith(os.altsep))
+    parts = os.path.normpath(pattern).split(os.sep)
+    wildcard_parts = [i for i, part in enumerate(parts) if _GLOB_CHARS_RE.search(part)]
+    if len(wildcard_parts) != 1 or wildcard_parts[0] == 0 or "**" in parts[wildcard_parts[0]]:
+        return [(match, os.path.isdir(match)) for match in glob.glob(pattern, recursive=False)]
+    
+    index = wildcard_parts[0]
+    base = os.sep.join(parts[:index])
+    if not base or base.endswith(':'): # Filesystem or drive root
+        base += os.sep
+    component = parts[index]
+    rest = parts[index + 1:]
+    
+    matches = []
+    try:
+        with os.scandir(base) as entries:
+            for entry in entries:
+                # glob skips hidden entries unless the pattern asks for them
+                if entry.name.startswith('.') and not component.startswith('.'):
+                    continue
+                if not fnmatch.fnmatch(entry.name, component):
+                    continue
+                if not rest:
+                    matches.append((entry.path, entry.is_dir()))
+                elif entry.is_dir():
+                    match_path = os.path.join(entry.path, *rest)
+                    try:
+                        matches.append((match_path, stat.S_ISDIR(os.stat(match_path).st_mode)))
+                    except OSError:
+                        pass
+    except OSError:
+        pass
+    if dirs_only:
+        matches = [(match_path, is_dir) for match_path, is_dir in matches if is_dir]
+    return matches
+
+def _resolve_save_path_template(store_type, path_template, parent_probes):
+    """Resolve one template into its table entries"""
+    items = []
+    path_template = _WIKI_TOKEN_RE.sub("*", path_template)
+    # PCGamingWiki templates arrive with the common %VARS% already substituted,
+    # so most need neither pass
+    expanded_path_template = path_template
+    if '%' in expanded_path_template or '$' in expanded_path_template:
+        expanded_path_template = os.path.expandvars(expanded_path_template)
+    if expanded_path_template.startswith('~'):
+        expanded_path_template = os.path.expanduser(expanded_path_template)
+
+    if "*" in expanded_path_template:
+        try:
+            # Ensure the base directory for glob exists if pattern is like "base_dir/*"
+            glob_base = os.path.dirname(expanded_path_template)
+            if "*" not in glob_base and not _probe_dir(glob_base, parent_probes): # only glob if base exists or base itself is a pattern
+                items.append({
+                    "store": store_type, "path": expanded_path_template, "original_template": path_template,
+                    "display_text": f"{store_type} (pattern, base missing): {expanded_path_template}",
+                    "exists": False, "parent_exists": False, "is_pattern_base_missing": True
+                })
+                return items
+
+            for match_path, is_dir in _match_save_path_pattern(expanded_path_template):
+                items.append({
+                    "store": store_type, "path": match_path, "original_template": path_template,
+                    "display_text": f"{store_type} (match): {match_path}",
+                    "exists": True, "parent_exists": True,
+                    "is_dir": is_dir
+                })
+        except Exception as e:
+            print(f"Error globbing {expanded_path_template}: {e}")
+            items.append({
+                "store": store_type, "path": expanded_path_template, "original_template": path_template,
+                "display_text": f"{store_type} (pattern, error): {expanded_path_template}",
+                "exists": False, "parent_exists": False, "is_pattern_error": True
+            })
+    else:
+        path_exists, is_dir = probe_path(expanded_path_template)
+        # An existing path implies an existing parent, so only stat the parent when needed
+        parent_exists = path_exists or _probe_dir(os.path.dirname(expanded_path_template), parent_probes)
+        if parent_exists: # Add if path or its parent exists
+            items.append({
+                "store": store_type, "path": expanded_path_template, "original_template": path_template,
+                "display_text": f"{store_type}: {expanded_path_template}",
+                "exists": path_exists, "parent_exists": parent_exists,
+                "is_dir": is_dir
+            })
+
+    return items
+
+SAVE_PATH_PROBE_WORKERS = 8
+_save_path_executor = None
+_save_path_executor_lock = threading.Lock()
+
+def _get_save_path_executor():
+    """Shared pool for save path probes, created on first use and kept for the app's lifetime"""
+    global _save_path_executor
+    with _save_path_executor_lock:
+        if _save_path_executor is None:
+            _save_path_executor = ThreadPoolExecutor(max_workers=SAVE_PATH_PROBE_WORKERS,
+                                                     thread_name_prefix="save-path-probe")
+        return _save_path_executor
+
+def resolve_save_path_templates(paths_dict):
+    """
+    Expand PCGamingWiki path templates and probe them on disk.
+    Does blocking filesystem I/O, so call it from a worker thread.
+    Returns a list of dicts describing each usable suggestion.
+    """
+    parent_probes = {}  # Templates for one game mostly share a few parent folders
+    templates = list(paths_dict.items())
+    if len(templates) <= 1:
+        resolved = [_resolve_save_path_template(store_type, path_template, parent_probes)
+                    for store_type, path_template in templates]
+    else:
+        # Probes are independent and mostly wait on the filesystem, which adds up on
+        # network or cloud-synced folders; map() keeps the template order
+        resolved = list(_get_save_path_executor().map(
+            lambda template: _resolve_save_path_template(template[0], template[1], parent_probes),
+            templates))
+    
+    items = [item for template_items in resolved for item in template_items]
+    for item in items:
+        item["kind"] = _save_path_kind(item)
+    return items
+
+def _save_path_kind(item):
+    """Classify a resolved entry once so the table can pick its style with a single lookup"""
+    if item.get("is_placeholder"):
+        return "placeholder"
+    if item.get("is_pattern_no_match") or item.get("is_pattern_error") or item.get("is_pattern_base_missing"):
+        return "pattern"
+    if item.get("exists"):
+        return "usable"
+    if item.get("exists") is False and item.get("parent_exists"):
+        return "parent_only"
+    return "other"
+
+@functools.lru_cache(maxsize=64)
+def _between_tags_re(start_tag, end_tag):
+    return re.compile(re.escape(start_tag) + "(.*?)" + re.escape(end_tag), re.DOTALL)
+
 def extract_between_tags(text, start_tag, end_tag):
     """Helper function to extract content between tags"""
-    result = []
-    start_len = len(start_tag)
-    end_len = len(end_tag)
-    
-    current_pos = 0
-    while True:
-        start_pos = text.find(start_tag, current_pos)
-        if start_pos == -1:
-            break
-            
-        start_pos += start_len
-        end_pos = text.find(end_tag, start_pos)
-        
-        if end_pos == -1:
-            break
-            
-        content = text[start_pos:end_pos]
-        result.append(content)
-        current_pos = end_pos + end_len
-        
-    return result
+    return [match.group(1) for match in _between_tags_re(start_tag, end_tag).finditer(text)]
 
 def get_igdb_api_source(config):
     api_source = config.get("igdb_api_source", "ambidex")
@@ -259,19 +496,20 @@ def get_igdb_api_source(config):
             "needs_auth": False
         }
 
+@functools.lru_cache(maxsize=None)
 def get_windows_accent_color():
     """
     Tries to get the Windows accent color.
     Returns a hex color string (e.g., "#RRGGBB") or a default blue if not found/not on Windows.
+    Read once per session; every game tile asks for it.
     """
     if platform.system() == "Windows":
         try:
             # The DWM AccentColor is an ABGR value (alpha, blue, green, red)
             # e.g., 0xAABBGGRR
             key_path = r"Software\\Microsoft\\Windows\\DWM"
-            key = winreg.OpenKey(winreg.HKEY_CURRENT_USER, key_path)
-            accent_color_dword, _ = winreg.QueryValueEx(key, "AccentColor")
-            winreg.CloseKey(key)
+            with winreg.OpenKey(winreg.HKEY_CURRENT_USER, key_path) as key:
+                accent_color_dword, _ = winreg.QueryValueEx(key, "AccentColor")
             
             # Extract R, G, B components
             # alpha = (accent_color_dword >> 24) & 0xFF
@@ -284,6 +522,7 @@ def get_windows_accent_color():
             pass
     return "#0078D4" # Default blue for non-Windows or if detection fails
 
+@functools.lru_cache(maxsize=None)
 def is_windows_11_or_later():
     """
     Checks if the current OS is Windows 11 or later based on the build number.
@@ -1,7 +1,81 @@
+import contextlib
 import os
 import requests
 import time
-from PySide6.QtCore import QObject, QRunnable, Signal
+from concurrent.futures import ThreadPoolExecutor
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, QTimer, Signal
+import shiboken6
+import utils
+
+
+# IGDB requests get their own small pool so they never queue behind other
+# users of the global Qt pool (and vice versa)
+IGDB_POOL = QThreadPool()
+IGDB_POOL.setMaxThreadCount(2)
+IGDB_POOL.setObjectName("igdb")
+
+
+THUMBNAIL_WORKERS = 8
+
+
+def _is_image_header(head):
+    """Cheap signature check for the formats the IGDB image CDN serves (JPEG, PNG, WebP)"""
+    return (head.startswith(b"\xff\xd8\xff") or head.startswith(b"\x89PNG\r\n\x1a\n")
+            or (head.startswith(b"RIFF") and head[8:12] == b"WEBP"))
+
+
+def _save_image_response(response, file_path):
+    """
+    Stream an image response into a temp file next to file_path, check it and swap it in.
+    Returns None on success or an error message; no temp file is left behind either way
+    """
+    temp_path = file_path + ".tmp"
+    try:
+        # Stream the body straight to disk rather than holding it all in memory
+        head = b""
+        try:
+            with open(temp_path, 'wb') as f:
+                for chunk in response.iter_content(chunk_size=64 * 1024):
+                    if len(head) < 12: # Chunks can be shorter than the signature
+                        head += chunk[:12 - len(head)]
+                    f.write(chunk)
+        except requests.exceptions.RequestException as e:
+            return f"Failed to download image: {str(e)}"
+        
+        if os.path.getsize(temp_path) < 100:
+            return "Downloaded image is too small or empty"
+        
+        # Checked before the swap so a bad download never replaces a good cover
+        if not _is_image_header(head):
+            return "Downloaded file is not a valid image"
+        
+        os.replace(temp_path, file_path)
+        return None
+    except IOError as e:
+        return f"Failed to save image: {str(e)}"
+    finally:
+        # Already gone after a successful swap; otherwise it is a partial or rejected download
+        with contextlib.suppress(OSError):
+            os.unlink(temp_path)
+
+
+def _fetch_thumbnail(game):
+    thumb_url = f"https://images.igdb.com/igdb/image/upload/t_micro/{game['cover']['image_id']}.jpg"
+    try:
+        thumb_response = utils.http_session.get(thumb_url, timeout=10)
+        if thumb_response.ok:
+            game["thumb_data"] = thumb_response.content
+    except Exception:
+        pass
+
+
+def _fetch_thumbnails(games):
+    """Download search result thumbnails concurrently; a failed one is just left out"""
+    games = [game for game in games if "image_id" in (game.get("cover") or {})]
+    if not games:
+        return
+    with ThreadPoolExecutor(max_workers=min(THUMBNAIL_WORKERS, len(games))) as executor:
+        list(executor.map(_fetch_thumbnail, games))
 
 
 class WorkerSignals(QObject):
@@ -10,6 +84,7 @@ class WorkerSignals(QObject):
     search_complete = Signal(list)
     search_failed = Signal(str)
     image_downloaded = Signal(str, str, str)  # game name, image path, official game name
+    save_locations_fetched = Signal(dict, list)  # raw templates, resolved path entries
     finished = Signal()
 
 
@@ -30,7 +105,7 @@ class LegacyIGDBAuthWorker(QRunnable):
                 "grant_type": "client_credentials"
             }
             
-            response = requests.post(url, data=payload)
+            response = utils.http_session.post(url, data=payload)
             response.raise_for_status()
             
             data = response.json()
@@ -73,19 +148,12 @@ class LegacyIGDBGameSearchWorker(QRunnable):
                 'Accept': 'application/json'
             }
             
-            response = requests.post(url, headers=headers, data=query)
+            response = utils.http_session.post(url, headers=headers, data=query)
             response.raise_for_status()
             
             games = response.json()
             
-            for game in games:
-                if "cover" in game:
-                    cover = game["cover"]
-                    if "image_id" in cover:
-                        thumb_url = f"https://images.igdb.com/igdb/image/upload/t_micro/{cover['image_id']}.jpg"
-                        thumb_response = requests.get(thumb_url)
-                        if thumb_response.ok:
-                            game["thumb_data"] = thumb_response.content
+            _fetch_thumbnails(games)
             
             self.signals.search_complete.emit(games)
             
@@ -104,11 +172,7 @@ class LegacyIGDBImageDownloadWorker(QRunnable):
         self.signals = WorkerSignals()
     
     def make_safe_filename(self, name):
-        safe_name = name.lower().replace(" ", "_")
-        for char in [':', '/', '\\', '*', '?', '"', '<', '>', '|', '.']:
-            safe_name = safe_name.replace(char, "_")
-        safe_name = ''.join(c for c in safe_name if c.isalnum() or c in ['_', '-'])
-        return safe_name
+        return utils.make_safe_filename(name)
     
     def run(self):
         try:
@@ -129,66 +193,30 @@ class LegacyIGDBImageDownloadWorker(QRunnable):
             image_url = f"https://images.igdb.com/igdb/image/upload/t_cover_big/{image_id}.jpg"
             
             try:
-                max_retries = 3
-                retry_count = 0
-                while retry_count < max_retries:
-                    try:
-                        response = requests.get(image_url, timeout=15)  
-                        response.raise_for_status()
-                        break
-                    except requests.exceptions.RequestException as e:
-                        retry_count += 1
-                        if retry_count >= max_retries:
-                            raise
-                        time.sleep(1)
+                # The shared session retries connection errors and 5xx responses
+                response = utils.http_session.get(image_url, timeout=15, stream=True)
+                response.raise_for_status()
             except requests.exceptions.RequestException as e:
                 self.signals.search_failed.emit(f"Failed to download image: {str(e)}")
                 return
             
-            try:
-                os.makedirs(self.destination_folder, exist_ok=True)
-            except OSError as e:
-                self.signals.search_failed.emit(f"Failed to create image directory: {str(e)}")
-                return
-            
-            try:
-                safe_name = self.make_safe_filename(self.game_data["name"])
-                file_path = os.path.join(self.destination_folder, f"{safe_name}.jpg")
-                
-                if len(response.content) < 100:  
-                    self.signals.search_failed.emit("Downloaded image is too small or empty")
-                    return
-                
-                temp_path = file_path + ".tmp"
-                with open(temp_path, 'wb') as f:
-                    f.write(response.content)
-                
-                if os.path.exists(file_path):
-                    os.unlink(file_path)
-                os.rename(temp_path, file_path)
-                
-                if not os.path.exists(file_path) or os.path.getsize(file_path) == 0:
-                    self.signals.search_failed.emit("Failed to save image file")
-                    return
-                
+            with response:
                 try:
-                    from PySide6.QtGui import QImageReader
-                    reader = QImageReader(file_path)
-                    if not reader.canRead():
-                        os.unlink(file_path)  
-                        self.signals.search_failed.emit("Downloaded file is not a valid image")
-                        return
-                except Exception:
-                    pass
+                    os.makedirs(self.destination_folder, exist_ok=True)
+                except OSError as e:
+                    self.signals.search_failed.emit(f"Failed to create image directory: {str(e)}")
+                    return
                 
-                self.signals.image_downloaded.emit(self.game_data["name"], file_path, self.game_data["name"])
-            except IOError as e:
-                self.signals.search_failed.emit(f"Failed to save image: {str(e)}")
-                return
-            except Exception as e:
-                self.signals.search_failed.emit(f"Error processing image: {str(e)}")
+                safe_name = self.make_safe_filename(self.game_data["name"])
+                file_path = os.path.join(self.destination_folder, f"{safe_name}.jpg")
+                error = _save_image_response(response, file_path)
+            
+            if error:
+                self.signals.search_failed.emit(error)
                 return
             
+            self.signals.image_downloaded.emit(self.game_data["name"], file_path, self.game_data["name"])
+            
         except Exception as e:
             self.signals.search_failed.emit(f"Image download failed: {str(e)}")
         finally:
@@ -212,7 +240,7 @@ class LegacyAPITestWorker(QRunnable):
                 'Accept': 'application/json'
             }
             
-            response = requests.post(url, headers=headers, data=query)
+            response = utils.http_session.post(url, headers=headers, data=query)
             response.raise_for_status()
             
             data = response.json()
@@ -240,7 +268,7 @@ class IGDBGameSearchWorker(QRunnable):
             
             params = {'search': self.game_name}
             
-            response = requests.get(url, params=params, timeout=15)
+            response = utils.http_session.get(url, params=params, timeout=15)
             response.raise_for_status()
             
             games = response.json()
@@ -249,15 +277,7 @@ class IGDBGameSearchWorker(QRunnable):
                 self.signals.search_failed.emit(f"API error: {games['error']}")
                 return
             
-            for game in games:
-                if "cover" in game and "image_id" in game["cover"]:
-                    thumb_url = f"https://images.igdb.com/igdb/image/upload/t_micro/{game['cover']['image_id']}.jpg"
-                    try:
-                        thumb_response = requests.get(thumb_url, timeout=10)
-                        if thumb_response.ok:
-                            game["thumb_data"] = thumb_response.content
-                    except Exception:
-                        pass
+            _fetch_thumbnails(games)
             
             self.signals.search_complete.emit(games)
             
@@ -279,11 +299,7 @@ class IGDBImageDownloadWorker(QRunnable):
         self.signals = WorkerSignals()
     
     def make_safe_filename(self, name):
-        safe_name = name.lower().replace(" ", "_")
-        for char in [':', '/', '\\', '*', '?', '"', '<', '>', '|', '.']:
-            safe_name = safe_name.replace(char, "_")
-        safe_name = ''.join(c for c in safe_name if c.isalnum() or c in ['_', '-'])
-        return safe_name
+        return utils.make_safe_filename(name)
     
     def run(self):
         try:
@@ -304,67 +320,122 @@ class IGDBImageDownloadWorker(QRunnable):
             image_url = f"https://images.igdb.com/igdb/image/upload/t_cover_big/{image_id}.jpg"
             
             try:
-                max_retries = 3
-                retry_count = 0
-                while retry_count < max_retries:
-                    try:
-                        response = requests.get(image_url, timeout=15)  
-                        response.raise_for_status()
-                        break
-                    except requests.exceptions.RequestException as e:
-                        retry_count += 1
-                        if retry_count >= max_retries:
-                            raise
-                        time.sleep(1)
+                # The shared session retries connection errors and 5xx responses
+                response = utils.http_session.get(image_url, timeout=15, stream=True)
+                response.raise_for_status()
             except requests.exceptions.RequestException as e:
                 self.signals.search_failed.emit(f"Failed to download image: {str(e)}")
                 return
             
-            try:
-                os.makedirs(self.destination_folder, exist_ok=True)
-            except OSError as e:
-                self.signals.search_failed.emit(f"Failed to create image directory: {str(e)}")
-                return
-            
-            try:
-                safe_name = self.make_safe_filename(self.game_data["name"])
-                file_path = os.path.join(self.destination_folder, f"{safe_name}.jpg")
-                
-                if len(response.content) < 100:  
-                    self.signals.search_failed.emit("Downloaded image is too small or empty")
-                    return
-                
-                temp_path = file_path + ".tmp"
-                with open(temp_path, 'wb') as f:
-                    f.write(response.content)
-                
-                if os.path.exists(file_path):
-                    os.unlink(file_path)
-                os.rename(temp_path, file_path)
-                
-                if not os.path.exists(file_path) or os.path.getsize(file_path) == 0:
-                    self.signals.search_failed.emit("Failed to save image file")
-                    return
-                
+            with response:
                 try:
-                    from PySide6.QtGui import QImageReader
-                    reader = QImageReader(file_path)
-                    if not reader.canRead():
-                        os.unlink(file_path)  
-                        self.signals.search_failed.emit("Downloaded file is not a valid image")
-                        return
-                except Exception:
-                    pass
+                    os.makedirs(self.destination_folder, exist_ok=True)
+                except OSError as e:
+                    self.signals.search_failed.emit(f"Failed to create image directory: {str(e)}")
+                    return
                 
-                self.signals.image_downloaded.emit(self.game_data["name"], file_path, self.game_data["name"])
-            except IOError as e:
-                self.signals.search_failed.emit(f"Failed to save image: {str(e)}")
-                return
-            except Exception as e:
-                self.signals.search_failed.emit(f"Error processing image: {str(e)}")
+                safe_name = self.make_safe_filename(self.game_data["name"])
+                file_path = os.path.join(self.destination_folder, f"{safe_name}.jpg")
+                error = _save_image_response(response, file_path)
+            
+            if error:
+                self.signals.search_failed.emit(error)
                 return
             
+            self.signals.image_downloaded.emit(self.game_data["name"], file_path, self.game_data["name"])
+            
         except Exception as e:
             self.signals.search_failed.emit(f"Image download failed: {str(e)}")
         finally:
             self.signals.finished.emit()
+
+
+class WikiFetchWorker(QRunnable):
+    def __init__(self, game_name):
+        super().__init__()
+        self.game_name = game_name
+        self.signals = WorkerSignals()
+    
+    def run(self):
+        try:
+            paths = utils.cached_fetch_pcgamingwiki_save_locations(self.game_name)
+            items = utils.resolve_save_path_templates(paths)
+            self.signals.save_locations_fetched.emit(paths, items)
+        except Exception as e:
+            print(f"PCGamingWiki fetch failed: {e}")
+            self.signals.save_locations_fetched.emit({}, []) # Still close the waiting loading dialog
+            self.signals.save_locations_fetched.emit({}, [])
+        finally:
+            self.signals.finished.emit()
+
+
+class SavePathProbeWorker(QRunnable):
+    def __init__(self, paths):
+        super().__init__()
+        self.paths = paths
+        self.signals = WorkerSignals()
+    
+    def run(self):
+        try:
+            items = utils.resolve_save_path_templates(self.paths)
+            self.signals.save_locations_fetched.emit(self.paths, items)
+        except Exception as e:
+            print(f"Save path probe failed: {e}")
+            self.signals.save_locations_fetched.emit(self.paths, [])
+        finally:
+            self.signals.finished.emit()
+
+
+class _IGDBRateLimiter:
+    """
+    Keeps game searches under IGDB's 4 requests/second limit and folds a search for a
+    name that is already in flight into the pending request. Only used from the GUI thread
+    """
+    MIN_INTERVAL = 0.25  # seconds between request starts
+    
+    def __init__(self):
+        self.in_flight = {}  # (client id, name) -> [(complete callback, failed callback, receiver)]
+        self.next_start = 0.0
+    
+    def search(self, auth_data, game_name, on_complete, on_failed, receiver=None):
+        key = (auth_data.get("client_id") if auth_data else None, game_name.strip().lower())
+        if key in self.in_flight:
+            self.in_flight[key].append((on_complete, on_failed, receiver))
+            return
+        self.in_flight[key] = [(on_complete, on_failed, receiver)]
+        
+        if auth_data:
+            worker = LegacyIGDBGameSearchWorker(auth_data, game_name)
+        else:
+            worker = IGDBGameSearchWorker(game_name)
+        worker.signals.search_complete.connect(lambda games: self._finish(key, 0, games))
+        worker.signals.search_failed.connect(lambda error: self._finish(key, 1, error))
+        
+        now = time.monotonic()
+        start = max(now, self.next_start)
+        self.next_start = start + self.MIN_INTERVAL
+        if start > now:
+            QTimer.singleShot(int((start - now) * 1000), lambda: IGDB_POOL.start(worker))
+        else:
+            IGDB_POOL.start(worker)
+    
+    def _finish(self, key, callback_index, result):
+        for callbacks in self.in_flight.pop(key, []):
+            receiver = callbacks[2]
+            if receiver is not None and not shiboken6.isValid(receiver):
+                continue  # The dialog that asked was closed while the search ran
+            try:
+                callbacks[callback_index](result)
+            except Exception as e:
+                # One failing caller must not keep the others sharing this search from their result
+                print(f"IGDB search callback failed: {e}")
+
+
+_igdb_limiter = _IGDBRateLimiter()
+
+def search_igdb_games(auth_data, game_name, on_complete, on_failed, receiver=None):
+    """
+    Search IGDB through the shared rate limiter; auth_data picks the legacy API over the proxy.
+    The callbacks are skipped once the receiver QObject has been deleted
+    """
+    _igdb_limiter.search(auth_data, game_name, on_complete, on_failed, receiver)